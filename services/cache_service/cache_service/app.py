@@ -88,6 +88,12 @@ app = create_app()
 
 
 if __name__ == "__main__":
-    import uvicorn
+    import asyncio
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
     port = int(os.getenv("PORT"))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Serve with hypercorn, as in the container: the service clients speak
+    # HTTP/2 with prior knowledge, which uvicorn does not accept
+    config = Config()
+    config.bind = [f"0.0.0.0:{port}"]
+    asyncio.run(serve(app, config))
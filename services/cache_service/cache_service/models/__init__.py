@@ -6,7 +6,7 @@ from pydantic import BaseModel, Field
 class DocumentCheckRequest(BaseModel):
     """Request to check if document is cached."""
     file_path: str
-    content: str
+    content_hash: str
 
 
 class DocumentCheckResponse(BaseModel):
@@ -35,15 +35,15 @@ class ChunksResponse(BaseModel):
 
 
 class ElementsSaveRequest(BaseModel):
-    """Request to save elements."""
+    """Request to save elements (one content string per chunk, in chunk order)."""
     document_id: str
-    elements: List[Dict[str, Any]]
+    contents: List[str]
 
 
 class SummariesSaveRequest(BaseModel):
-    """Request to save summaries."""
+    """Request to save summaries (one summary per element, in element order)."""
     document_id: str
-    summaries: List[Dict[str, Any]]
+    contents: List[str]
 
 
 class SummariesResponse(BaseModel):
@@ -35,7 +35,7 @@ async def check_document(
         ```json
         {
             "file_path": "/path/to/document.txt",
-            "content": "Sample content..."
+            "content_hash": "9f86d081884c7d65..."
         }
         ```
         
@@ -50,7 +50,7 @@ async def check_document(
     try:
         cached, document_id = neo4j.check_document_cached(
             request.file_path,
-            request.content
+            request.content_hash
         )
         return DocumentCheckResponse(cached=cached, document_id=document_id)
     except Exception as e:
@@ -1,10 +1,16 @@
 """Summary-related routes."""
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Type, TypeVar
+
+import msgpack
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import BaseModel
 from cache_service.models import SummariesSaveRequest, SummariesResponse, ElementsSaveRequest
 from cache_service.services.neo4j_service import Neo4jService
 
 router = APIRouter(tags=["summaries"])
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 def get_neo4j_service() -> Neo4jService:
     """Dependency to get Neo4j service."""
@@ -12,44 +18,72 @@ def get_neo4j_service() -> Neo4jService:
     return neo4j_service
 
 
+async def parse_msgpack_body(request: Request, model: Type[ModelT]) -> ModelT:
+    """Decode a msgpack request body and validate it against a model.
+    
+    Args:
+        request: Incoming request with an application/msgpack body
+        model: Pydantic model to validate the decoded payload against
+        
+    Returns:
+        Validated model instance
+        
+    Raises:
+        HTTPException: 400 if the body is not valid msgpack or fails validation
+    """
+    try:
+        payload = msgpack.unpackb(await request.body(), raw=False)
+        return model.model_validate(payload)
+    except (ValueError, msgpack.UnpackException) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid msgpack body: {e}")
+
+
 @router.post("/elements")
 async def save_elements(
-    request: ElementsSaveRequest,
+    request: Request,
     neo4j: Neo4jService = Depends(get_neo4j_service)
 ):
     """Save extracted elements for a document.
     
+    The body is msgpack-encoded ``{"document_id": str, "contents": [str, ...]}``
+    where the chunk index of each element is its position in ``contents``.
+    
     Args:
-        request: Elements save request
+        request: Request with a msgpack-encoded ElementsSaveRequest body
         neo4j: Neo4j service instance
         
     Returns:
         Success status with element count
     """
+    elements = await parse_msgpack_body(request, ElementsSaveRequest)
     try:
-        neo4j.save_elements(request.document_id, request.elements)
-        return {"status": "success", "count": len(request.elements)}
+        neo4j.save_elements(elements.document_id, elements.contents)
+        return {"status": "success", "count": len(elements.contents)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/summaries")
 async def save_summaries(
-    request: SummariesSaveRequest,
+    request: Request,
     neo4j: Neo4jService = Depends(get_neo4j_service)
 ):
     """Save summaries for a document.
     
+    The body is msgpack-encoded ``{"document_id": str, "contents": [str, ...]}``
+    where the element index of each summary is its position in ``contents``.
+    
     Args:
-        request: Summaries save request
+        request: Request with a msgpack-encoded SummariesSaveRequest body
         neo4j: Neo4j service instance
         
     Returns:
         Success status with summary count
     """
+    summaries = await parse_msgpack_body(request, SummariesSaveRequest)
     try:
-        neo4j.save_summaries(request.document_id, request.summaries)
-        return {"status": "success", "count": len(request.summaries)}
+        neo4j.save_summaries(summaries.document_id, summaries.contents)
+        return {"status": "success", "count": len(summaries.contents)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
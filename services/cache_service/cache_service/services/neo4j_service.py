@@ -84,10 +84,8 @@ class Neo4jService:
             
             logger.info("Neo4j schema created/verified")
     
-    def check_document_cached(self, file_path: str, content: str) -> tuple[bool, Optional[str]]:
-        """Check if document is already cached."""
-        content_hash = hashlib.md5(content.encode()).hexdigest()
-        
+    def check_document_cached(self, file_path: str, content_hash: str) -> tuple[bool, Optional[str]]:
+        """Check if document is already cached, by SHA-256 hex digest of its content."""
         with self.driver.session(database=self.settings.database) as session:
             result = session.run(
                 """
@@ -105,7 +103,7 @@ class Neo4jService:
     
     def save_document(self, document_id: str, file_path: str, content: str, metadata: Optional[Dict] = None):
         """Save document to Neo4j."""
-        content_hash = hashlib.md5(content.encode()).hexdigest()
+        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
         
         # Convert metadata to JSON string for Neo4j storage
         metadata_json = json.dumps(metadata) if metadata else "{}"
@@ -181,10 +179,15 @@ class Neo4jService:
             
             return chunks
     
-    def save_elements(self, document_id: str, elements: List[Dict[str, Any]]):
-        """Save extracted elements to Neo4j."""
+    def save_elements(self, document_id: str, elements: List[str]):
+        """Save extracted elements to Neo4j.
+        
+        Args:
+            document_id: Document identifier
+            elements: Element contents, indexed by the chunk they were extracted from
+        """
         with self.driver.session(database=self.settings.database) as session:
-            for idx, element in enumerate(elements):
+            for idx, content in enumerate(elements):
                 element_id = f"{document_id}_element_{idx}"
                 session.run(
                     """
@@ -198,14 +201,19 @@ class Neo4jService:
                     """,
                     document_id=document_id,
                     element_id=element_id,
-                    content=element.get("content", ""),
-                    chunk_index=element.get("chunk_index", idx),
+                    content=content,
+                    chunk_index=idx,
                     element_index=idx
                 )
             logger.info(f"Saved {len(elements)} elements for document {document_id}")
     
-    def save_summaries(self, document_id: str, summaries: List[Dict[str, Any]]):
-        """Save element summaries to Neo4j."""
+    def save_summaries(self, document_id: str, summaries: List[str]):
+        """Save element summaries to Neo4j.
+        
+        Args:
+            document_id: Document identifier
+            summaries: Summary texts, indexed by the element they summarize
+        """
         with self.driver.session(database=self.settings.database) as session:
             for idx, summary in enumerate(summaries):
                 summary_id = f"{document_id}_summary_{idx}"
@@ -221,8 +229,8 @@ class Neo4jService:
                     """,
                     document_id=document_id,
                     summary_id=summary_id,
-                    summary=summary.get("summary", ""),
-                    element_id=summary.get("element_id", idx),
+                    summary=summary,
+                    element_id=idx,
                     summary_index=idx
                 )
             logger.info(f"Saved {len(summaries)} summaries for document {document_id}")
@@ -1,6 +1,6 @@
 """Document processing routes."""
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Literal
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
@@ -18,6 +18,7 @@ class ChunkRequest(BaseModel):
     content: str
     chunk_size: int
     chunk_overlap: int
+    chunk_unit: Literal["characters", "tokens"] = "characters"
 
 
 class ChunkResponse(BaseModel):
@@ -26,7 +27,7 @@ class ChunkResponse(BaseModel):
 
 class DocumentIdRequest(BaseModel):
     file_path: str
-    content: str
+    content_hash: str
 
 
 # Initialize service
@@ -35,10 +36,10 @@ document_service = DocumentService()
 
 @router.post("/generate-id", response_model=dict)
 async def generate_id(request: DocumentIdRequest):
-    """Generate document ID from file path and content.
+    """Generate document ID from file path and content hash.
     
     Args:
-        request: Request containing file path and content.
+        request: Request containing file path and SHA-256 hex digest of the content.
         
     Returns:
         dict: Dictionary with generated document_id.
@@ -48,7 +49,7 @@ async def generate_id(request: DocumentIdRequest):
         ```json
         {
             "file_path": "/path/to/document.txt",
-            "content": "Sample document content..."
+            "content_hash": "a1b2c3d4e5f6g7h8..."
         }
         ```
         
@@ -62,7 +63,7 @@ async def generate_id(request: DocumentIdRequest):
     try:
         doc_id = document_service.generate_document_id(
             request.file_path,
-            request.content
+            request.content_hash
         )
         return {"document_id": doc_id}
     except Exception as e:
@@ -87,7 +88,8 @@ async def chunk_text(request: ChunkRequest):
             "document_id": "document.txt_a1b2c3d4",
             "content": "This is a long document...",
             "chunk_size": 1000,
-            "chunk_overlap": 200
+            "chunk_overlap": 200,
+            "chunk_unit": "characters"
         }
         ```
         
@@ -111,7 +113,8 @@ async def chunk_text(request: ChunkRequest):
             request.document_id,
             request.content,
             request.chunk_size,
-            request.chunk_overlap
+            request.chunk_overlap,
+            request.chunk_unit
         )
         
         logger.info(
@@ -1,11 +1,22 @@
 """Document processing business logic."""
 import logging
 import os
-import hashlib
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
+
+import tiktoken
 
 logger = logging.getLogger(__name__)
 
+# Tokenizer for token-based chunking; o200k_base is the encoding of gpt-4o
+TOKENIZER_ENCODING = os.getenv("TOKENIZER_ENCODING", "o200k_base")
+
+
+@lru_cache
+def get_encoding() -> tiktoken.Encoding:
+    """Return the tokenizer used for token-based chunking, loaded on first use."""
+    return tiktoken.get_encoding(TOKENIZER_ENCODING)
+
 
 class DocumentService:
     """Service for document processing operations.
@@ -15,51 +26,90 @@ class DocumentService:
     """
     
     @staticmethod
-    def generate_document_id(file_path: str, content: str) -> str:
+    def generate_document_id(file_path: str, content_hash: str) -> str:
         """Generate unique document ID based on file path and content hash.
         
         Args:
             file_path: Path to the document file.
-            content: Document content.
+            content_hash: SHA-256 hex digest of the document content.
             
         Returns:
             str: Unique document identifier combining filename and content hash.
         """
-        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
         filename = os.path.basename(file_path)
-        return f"{filename}_{content_hash}"
+        return f"{filename}_{content_hash[:16]}"
+    
+    @staticmethod
+    def token_spans(content: str, chunk_size: int, stride: int) -> List[Tuple[int, int]]:
+        """Compute the character spans of sliding windows over the tokens of a text.
+        
+        Windows hold chunk_size tokens and advance by stride tokens. Their bounds
+        are mapped back to character offsets, so chunks are cut at token starts
+        and never split a character.
+        
+        Args:
+            content: Text to split.
+            chunk_size: Number of tokens per window.
+            stride: Number of tokens between the starts of consecutive windows.
+            
+        Returns:
+            List[Tuple[int, int]]: Start and end character offset of each window.
+        """
+        encoding = get_encoding()
+        _, token_starts = encoding.decode_with_offsets(encoding.encode(content, disallowed_special=()))
+        token_count = len(token_starts)
+        content_length = len(content)
+        return [
+            (
+                token_starts[start],
+                token_starts[start + chunk_size] if start + chunk_size < token_count else content_length
+            )
+            for start in range(0, token_count, stride)
+        ]
     
     @staticmethod
     def chunk_document(
         document_id: str,
         content: str,
         chunk_size: int,
-        chunk_overlap: int
+        chunk_overlap: int,
+        chunk_unit: str = "characters"
     ) -> List[Dict[str, Any]]:
         """Split document into overlapping chunks.
         
         Args:
             document_id: Unique identifier for the document.
             content: Document content to chunk.
-            chunk_size: Size of each chunk in characters.
-            chunk_overlap: Number of overlapping characters between chunks.
+            chunk_size: Size of each chunk, in chunk_unit.
+            chunk_overlap: Overlap between consecutive chunks, in chunk_unit.
+            chunk_unit: "characters", or "tokens" to bound the number of tokens
+                each chunk sends to the model.
             
         Returns:
             List[Dict[str, Any]]: List of chunk dictionaries containing content,
                 document_id, chunk_index, start_pos, and end_pos.
         """
-        chunks = []
+        stride = chunk_size - chunk_overlap
+        if chunk_unit == "tokens":
+            spans = DocumentService.token_spans(content, chunk_size, stride)
+        else:
+            # Sliding window of chunk_size characters, advancing by the stride
+            content_length = len(content)
+            spans = [
+                (start, min(start + chunk_size, content_length))
+                for start in range(0, content_length, stride)
+            ]
         
-        for i in range(0, len(content), chunk_size - chunk_overlap):
-            chunk_content = content[i:i + chunk_size]
-            chunk = {
-                "content": chunk_content,
+        chunks = [
+            {
+                "content": content[start:end],
                 "document_id": document_id,
-                "chunk_index": len(chunks),
-                "start_pos": i,
-                "end_pos": min(i + chunk_size, len(content))
+                "chunk_index": index,
+                "start_pos": start,
+                "end_pos": end
             }
-            chunks.append(chunk)
+            for index, (start, end) in enumerate(spans)
+        ]
         
-        logger.debug(f"Created {len(chunks)} chunks for document {document_id}")
+        logger.debug("Created %d chunks for document %s", len(chunks), document_id)
         return chunks
@@ -1,10 +1,11 @@
 """Graph Processing FastAPI microservice."""
 import logging
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from routes.graph_routes import router as graph_router
+from routes.graph_routes import router as graph_router, graph_service, llm_client
 from routes.health_routes import router as health_router
 from middleware import SecurityHeadersMiddleware
 
@@ -16,11 +17,35 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage application lifespan.
+    
+    Handles startup and shutdown of the graph processing service,
+    including the summary parse worker pool and the LLM service client.
+    
+    Args:
+        app: FastAPI application instance.
+        
+    Yields:
+        None: Control to the application during its lifetime.
+    """
+    # Startup
+    graph_service.start_parse_pool()
+    logger.info("Graph processing service started")
+    yield
+    # Shutdown
+    await llm_client.close()
+    graph_service.close()
+    logger.info("Graph processing service shutting down")
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Graph Processing Service",
     description="Knowledge graph building and community detection",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add security headers middleware
@@ -32,5 +57,11 @@ app.include_router(graph_router)
 
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8005)
+    import asyncio
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+    # Serve with hypercorn, as in the container: the service clients speak
+    # HTTP/2 with prior knowledge, which uvicorn does not accept
+    config = Config()
+    config.bind = ["0.0.0.0:8005"]
+    asyncio.run(serve(app, config))
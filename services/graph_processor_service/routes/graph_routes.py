@@ -2,10 +2,12 @@
 import logging
 from typing import List, Dict, Any
 
+import httpx
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from services.graph_service import GraphService
+from services.llm_client import LLMServiceClient
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +35,18 @@ class CommunityDescriptionRequest(BaseModel):
     community_members: List[str]
 
 
-# Initialize service
+class DescribeAndSummarizeRequest(BaseModel):
+    communities: List[List[str]]
+
+
+class DescribeAndSummarizeResponse(BaseModel):
+    descriptions: List[Dict[str, Any]]
+    summaries: List[str]
+
+
+# Initialize services
 graph_service = GraphService()
+llm_client = LLMServiceClient()
 
 
 @router.post("/graph/build", response_model=GraphResponse)
@@ -49,7 +61,7 @@ async def build_and_analyze_graph(request: BuildGraphRequest):
     """
     try:
         # Build graph
-        graph_stats = graph_service.build_graph(request.summaries)
+        graph_stats = await graph_service.build_graph(request.summaries)
         
         # Detect communities
         communities_data = graph_service.detect_communities()
@@ -90,3 +102,39 @@ async def describe_community(request: CommunityDescriptionRequest):
     except Exception as e:
         logger.exception("Error describing community")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/community/describe-and-summarize", response_model=DescribeAndSummarizeResponse)
+async def describe_and_summarize_communities(request: DescribeAndSummarizeRequest):
+    """Describe communities and summarize them with the LLM service.
+    
+    Descriptions are built from the current graph and passed directly to
+    the LLM service, so callers need a single round trip for both steps.
+    
+    Args:
+        request: Request containing the members of each community
+        
+    Returns:
+        Response with one description and one summary per community
+    """
+    try:
+        descriptions = [
+            graph_service.get_community_description(members)
+            for members in request.communities
+        ]
+        summaries = await llm_client.summarize_communities(descriptions)
+        
+        return DescribeAndSummarizeResponse(
+            descriptions=descriptions,
+            summaries=summaries
+        )
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except httpx.HTTPStatusError as e:
+        # Pass the LLM service's status on, so callers can tell whether to retry
+        logger.exception("Error summarizing communities")
+        raise HTTPException(status_code=e.response.status_code, detail=e.response.text)
+    except Exception as e:
+        logger.exception("Error describing and summarizing communities")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,11 +1,36 @@
 """Graph processing business logic."""
+import asyncio
 import logging
-from typing import List, Dict, Any, Tuple
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 
 import igraph as ig
 
 logger = logging.getLogger(__name__)
 
+# Section headers: "Entities:" / "Relationships:" anywhere in a line, or the bare word
+_ENTITIES_HEADER_RE = re.compile(r"entities:|^entities$", re.IGNORECASE)
+_RELATIONSHIPS_HEADER_RE = re.compile(r"relationships:|^relationships$", re.IGNORECASE)
+# Numbering and bullet characters in front of an entity
+_ENTITY_BULLET_RE = re.compile(r"^[0-9.\-*• ]+")
+# "Source -> relation -> Target"; anything after a third arrow is ignored. The
+# bullet prefix never takes the "-" of an arrow, so a line starting with "->"
+# has an empty source
+_RELATIONSHIP_RE = re.compile(r"^(?:[*• ]|-(?!>))*\s*(.*?)\s*->\s*(.*?)\s*->\s*(.*?)\s*(?:->|$)")
+# Keys of JSON-like structures that are skipped
+_JSON_KEYS_RE = re.compile(r'"(?:id|name|type|attributes)":')
+# Attribute lines that are not entities
+_ATTRIBUTE_PREFIX_RE = re.compile(r"(?:name|type|attributes|popularity):")
+
+# Below this many summaries parsing stays in-process, as starting worker
+# processes would cost more than it saves
+PARALLEL_PARSE_MIN_SUMMARIES = 2000
+# Summaries sent to a parse worker per task
+PARSE_CHUNK_SIZE = 256
+
 
 class GraphService:
     """Service for graph building and community detection.
@@ -18,6 +43,32 @@ class GraphService:
     def __init__(self):
         """Initialize graph service with empty graph instance."""
         self.current_graph: ig.Graph = None
+        # Vertex index of each entity name in the current graph
+        self.name_to_idx: Dict[str, int] = {}
+        # Processes used to parse large summary sets
+        self.parse_workers: int = int(os.getenv("GRAPH_PARSE_WORKERS", os.cpu_count() or 1))
+        # Long-lived worker pool, created by start_parse_pool() at application startup
+        self.parse_pool: Optional[ProcessPoolExecutor] = None
+    
+    def start_parse_pool(self) -> None:
+        """Start the worker processes used to parse large summary sets.
+        
+        The pool lives for the whole application, so no request pays for
+        starting processes. Workers are spawned rather than forked from the
+        running server process.
+        """
+        if self.parse_workers > 1 and self.parse_pool is None:
+            self.parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info("Started graph parse pool with %d processes", self.parse_workers)
+    
+    def close(self) -> None:
+        """Shut down the parse worker pool."""
+        if self.parse_pool is not None:
+            self.parse_pool.shutdown()
+            self.parse_pool = None
     
     @staticmethod
     def parse_summary(summary: str) -> Tuple[List[str], List[Tuple[str, str, str]]]:
@@ -33,51 +84,89 @@ class GraphService:
         entities = []
         relationships = []
         
-        lines = summary.split("\n")
-        is_entities_section = False
-        is_relationships_section = False
+        section = None
         
-        for line in lines:
+        for line in summary.split("\n"):
             line = line.strip()
             if not line:
                 continue
             
-            # Detect section headers
-            line_lower = line.lower()
-            if "entities:" in line_lower or (line_lower == "entities" and not is_relationships_section):
-                is_entities_section = True
-                is_relationships_section = False
+            # Detect section headers; "entities:" wins if a line names both
+            header = _ENTITIES_HEADER_RE.search(line)
+            # A bare "entities" line inside the relationships section is not a header
+            if header and (header.group().endswith(":") or section != "relationships"):
+                section = "entities"
                 continue
-            elif "relationships:" in line_lower or line_lower == "relationships":
-                is_entities_section = False
-                is_relationships_section = True
+            if _RELATIONSHIPS_HEADER_RE.search(line):
+                section = "relationships"
                 continue
             
             # Skip JSON-like structures
-            if line.startswith(("{", "}", "[", "]")) or any(
-                key in line for key in ['"id":', '"name":', '"type":', '"attributes":']
-            ):
+            if line.startswith(("{", "}", "[", "]")) or _JSON_KEYS_RE.search(line):
                 continue
             
-            if is_entities_section:
-                entity = line.lstrip("0123456789.-*• ").replace("**", "").strip()
-                if entity and not any(
-                    prefix in entity for prefix in ["name:", "type:", "attributes:", "popularity:"]
-                ):
+            if section == "entities":
+                entity = _ENTITY_BULLET_RE.sub("", line).replace("**", "").strip()
+                if entity and not _ATTRIBUTE_PREFIX_RE.search(entity):
                     entities.append(entity)
             
-            elif is_relationships_section and "->" in line:
-                parts = [p.strip() for p in line.split("->")]
-                if len(parts) >= 3:
-                    source = parts[0].lstrip("-*• ").strip()
-                    relation = parts[1].strip()
-                    target = parts[2].strip()
+            elif section == "relationships":
+                match = _RELATIONSHIP_RE.match(line)
+                if match:
+                    source, relation, target = match.groups()
                     if source and target:
                         relationships.append((source, relation, target))
         
         return entities, relationships
     
-    def build_graph(self, summaries: List[str]) -> Dict[str, Any]:
+    @staticmethod
+    def parse_summary_batch(
+        summaries: List[str]
+    ) -> List[Tuple[List[str], List[Tuple[str, str, str]]]]:
+        """Parse a batch of summaries; the unit of work sent to a parse worker.
+        
+        Args:
+            summaries: List of text summaries containing entities and relationships.
+            
+        Returns:
+            List[Tuple[List[str], List[Tuple[str, str, str]]]]: The result of
+                ``parse_summary`` for each summary, in input order.
+        """
+        return [GraphService.parse_summary(summary) for summary in summaries]
+    
+    async def parse_summaries(
+        self,
+        summaries: List[str]
+    ) -> List[Tuple[List[str], List[Tuple[str, str, str]]]]:
+        """Parse summaries without blocking the event loop.
+        
+        Parsing is pure-Python and CPU-bound, so beyond a few thousand summaries
+        it is split across the parse worker pool; smaller sets are parsed in a
+        thread. Results are returned in input order either way.
+        
+        Args:
+            summaries: List of text summaries containing entities and relationships.
+            
+        Returns:
+            List[Tuple[List[str], List[Tuple[str, str, str]]]]: The entities and
+                relationships of each summary, as returned by ``parse_summary``.
+        """
+        if self.parse_pool is None or len(summaries) < PARALLEL_PARSE_MIN_SUMMARIES:
+            return await asyncio.to_thread(self.parse_summary_batch, summaries)
+        
+        logger.info("Parsing %d summaries in %d processes", len(summaries), self.parse_workers)
+        loop = asyncio.get_running_loop()
+        batches = await asyncio.gather(*(
+            loop.run_in_executor(
+                self.parse_pool,
+                self.parse_summary_batch,
+                summaries[start:start + PARSE_CHUNK_SIZE]
+            )
+            for start in range(0, len(summaries), PARSE_CHUNK_SIZE)
+        ))
+        return [parsed for batch in batches for parsed in batch]
+    
+    async def build_graph(self, summaries: List[str]) -> Dict[str, Any]:
         """Build knowledge graph from summaries.
         
         Args:
@@ -86,43 +175,63 @@ class GraphService:
         Returns:
             Dict[str, Any]: Dictionary with graph statistics including node and edge counts.
         """
-        logger.info(f"Building graph from {len(summaries)} summaries")
+        logger.info("Building graph from %d summaries", len(summaries))
+        
+        parsed = await self.parse_summaries(summaries)
+        graph, name_to_idx = await asyncio.to_thread(self._assemble_graph, parsed)
+        
+        self.current_graph = graph
+        self.name_to_idx = name_to_idx
         
-        vertices = set()
+        logger.info("Graph built with %d nodes and %d edges", graph.vcount(), graph.ecount())
+        
+        return {
+            "nodes": graph.vcount(),
+            "edges": graph.ecount()
+        }
+    
+    @staticmethod
+    def _assemble_graph(
+        parsed: List[Tuple[List[str], List[Tuple[str, str, str]]]]
+    ) -> Tuple[ig.Graph, Dict[str, int]]:
+        """Create the graph from parsed entities and relationships.
+        
+        Args:
+            parsed: The entities and relationships of each summary.
+            
+        Returns:
+            Tuple[ig.Graph, Dict[str, int]]: The graph and the vertex index of
+                each entity name.
+        """
+        # Vertices are numbered in the order entities are first seen, so edges
+        # are collected as integer id pairs and igraph never resolves names
+        name_to_idx: Dict[str, int] = {}
         edges = []
         edge_labels = []
         
-        for idx, summary in enumerate(summaries):
-            entities, relationships = self.parse_summary(summary)
+        for entities, relationships in parsed:
             
             # Add entities as vertices
             for entity in entities:
-                vertices.add(entity)
+                name_to_idx.setdefault(entity, len(name_to_idx))
             
             # Add relationships as edges
             for source, relation, target in relationships:
-                vertices.add(source)
-                vertices.add(target)
-                edges.append((source, target))
+                source_idx = name_to_idx.setdefault(source, len(name_to_idx))
+                target_idx = name_to_idx.setdefault(target, len(name_to_idx))
+                edges.append((source_idx, target_idx))
                 edge_labels.append(relation)
         
-        # Create graph
-        graph = ig.Graph()
-        vertex_list = list(vertices)
-        graph.add_vertices(vertex_list)
-        
-        if edges:
-            graph.add_edges(edges)
-            graph.es["label"] = edge_labels
-        
-        self.current_graph = graph
+        # Create the graph in a single call, passing names and labels as columns
+        graph = ig.Graph(
+            n=len(name_to_idx),
+            edges=edges,
+            directed=False,
+            vertex_attrs={"name": list(name_to_idx)},
+            edge_attrs={"label": edge_labels}
+        )
         
-        logger.info(f"Graph built with {graph.vcount()} nodes and {graph.ecount()} edges")
-        
-        return {
-            "nodes": graph.vcount(),
-            "edges": graph.ecount()
-        }
+        return graph, name_to_idx
     
     def detect_communities(self, min_community_size: int = 3, resolution: float = 1.0) -> List[Dict[str, Any]]:
         """Detect communities using Leiden algorithm with smarter merging.
@@ -141,59 +250,59 @@ class GraphService:
         if self.current_graph is None:
             raise ValueError("No graph available. Build graph first.")
         
-        logger.info(f"Detecting communities (min_size={min_community_size}, resolution={resolution})")
-        communities = []
+        logger.info("Detecting communities (min_size=%s, resolution=%s)", min_community_size, resolution)
+        graph = self.current_graph
+        # Vertex names in index order, fetched once for mapping partitions back to names
+        names = graph.vs["name"]
         
         # For small graphs, use a single community or simple partitioning
-        if self.current_graph.vcount() < 10:
+        if graph.vcount() < 10:
             logger.info("Small graph detected, using single community")
             return [{
                 "community_id": 0,
-                "members": [v["name"] for v in self.current_graph.vs],
-                "size": self.current_graph.vcount()
+                "members": names,
+                "size": graph.vcount()
             }]
         
-        # For larger graphs, use Leiden with lower resolution for fewer communities
+        # For larger graphs, use Leiden with lower resolution for fewer communities;
+        # it runs once over the whole graph, disconnected components included
         try:
-            partition = self.current_graph.community_leiden(
+            partition = graph.community_leiden(
                 objective_function='modularity',
                 resolution_parameter=resolution,
                 n_iterations=3  # Limit iterations for speed
             )
-            
-            # Group communities and merge small ones
-            temp_communities = []
-            small_members = []
-            
-            for community_indices in partition:
-                members = [self.current_graph.vs[i]["name"] for i in community_indices]
-                if len(members) >= min_community_size:
-                    temp_communities.append(members)
-                else:
-                    small_members.extend(members)
-            
-            # Merge all small communities into one if they exist
-            if small_members:
-                temp_communities.append(small_members)
-            
-            # Create final community list
-            for idx, members in enumerate(temp_communities):
-                communities.append({
-                    "community_id": idx,
-                    "members": members,
-                    "size": len(members)
-                })
-            
-        except Exception as e:
-            logger.exception("Error in community detection, using single community fallback")
-            # Fallback: treat entire graph as one community
-            communities = [{
-                "community_id": 0,
-                "members": [v["name"] for v in self.current_graph.vs],
-                "size": self.current_graph.vcount()
-            }]
+        except Exception:
+            logger.exception("Error in community detection, using connected components fallback")
+            # Fallback: treat each connected component as a community
+            partition = graph.connected_components()
+        
+        # Group communities and merge small ones
+        temp_communities = []
+        small_members = []
+        
+        for community_indices in partition:
+            members = [names[i] for i in community_indices]
+            if len(members) >= min_community_size:
+                temp_communities.append(members)
+            else:
+                small_members.extend(members)
+        
+        # Merge all small communities into one if they exist
+        if small_members:
+            temp_communities.append(small_members)
+        
+        # Create final community list
+        communities = [
+            {
+                "community_id": idx,
+                "members": members,
+                "size": len(members)
+            }
+            for idx, members in enumerate(temp_communities)
+        ]
         
-        logger.info(f"Detected {len(communities)} communities")
+        logger.info("Detected %d communities", len(communities))
         return communities
     
     def get_community_description(self, community_members: List[str]) -> Dict[str, Any]:
@@ -213,20 +322,20 @@ class GraphService:
             raise ValueError("No graph available. Build graph first.")
         
         try:
-            vertex_indices = [
-                self.current_graph.vs.find(name=node).index
-                for node in community_members
-            ]
-            subgraph = self.current_graph.subgraph(vertex_indices)
+            # Dictionary lookups instead of a linear vs.find() scan per member
+            vertex_indices = sorted({self.name_to_idx[node] for node in community_members})
             
-            entities = [subgraph.vs[i]["name"] for i in range(subgraph.vcount())]
+            # Select the community's edges in place rather than copying its
+            # vertices and edges into a subgraph
+            graph = self.current_graph
+            names = graph.vs["name"]
+            entities = [names[idx] for idx in vertex_indices]
+            has_labels = "label" in graph.es.attributes()
             relationships = []
             
-            for edge in subgraph.es:
-                source = subgraph.vs[edge.source]['name']
-                target = subgraph.vs[edge.target]['name']
-                label = edge['label'] if 'label' in edge.attributes() else 'related_to'
-                relationships.append(f"{source} -> {label} -> {target}")
+            for edge in graph.es.select(_within=vertex_indices):
+                label = edge["label"] if has_labels else 'related_to'
+                relationships.append(f"{names[edge.source]} -> {label} -> {names[edge.target]}")
             
             return {
                 'entities': entities,
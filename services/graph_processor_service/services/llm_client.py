@@ -0,0 +1,63 @@
+"""HTTP client for the LLM operations service."""
+import logging
+import os
+from typing import List, Dict, Any, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class LLMServiceClient:
+    """Client for LLM operations microservice.
+    
+    Used by the graph processor to hand community descriptions straight to
+    the LLM service instead of round-tripping them through the orchestrator.
+    """
+    
+    def __init__(self):
+        """Initialize LLM service client with configuration from environment variables.
+        
+        Raises:
+            ValueError: If required environment variables are not set.
+        """
+        self.base_url: str = os.getenv("LLM_SERVICE_URL")
+        if not self.base_url:
+            raise ValueError("LLM_SERVICE_URL environment variable is required")
+        
+        self.timeout = 300.0  # Longer timeout for LLM operations
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create persistent HTTP client."""
+        if self._client is None:
+            # HTTP/2 with prior knowledge; the LLM service runs under hypercorn.
+            # Its requests all go over one connection, to one LLM service worker
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                transport=httpx.AsyncHTTPTransport(http1=False, http2=True)
+            )
+        return self._client
+    
+    async def close(self):
+        """Close the HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def summarize_communities(self, descriptions: List[Dict[str, Any]]) -> List[str]:
+        """Summarize communities.
+        
+        Args:
+            descriptions: List of community description dictionaries.
+        
+        Returns:
+            List[str]: One summary per community description.
+        """
+        client = await self._get_client()
+        response = await client.post(
+            f"{self.base_url}/summarize/communities",
+            json={"descriptions": descriptions}
+        )
+        response.raise_for_status()
+        return response.json()["summaries"]
@@ -0,0 +1,14 @@
+"""Tests for summary parsing in the graph service."""
+from services.graph_service import GraphService
+
+
+def test_parse_summary_ignores_line_starting_with_arrow():
+    summary = "Relationships:\n->Alice -> knows -> Bob"
+    
+    assert GraphService.parse_summary(summary) == ([], [])
+
+
+def test_parse_summary_strips_bullet_before_relationship():
+    summary = "Relationships:\n- Alice -> knows -> Bob"
+    
+    assert GraphService.parse_summary(summary) == ([], [("Alice", "knows", "Bob")])
@@ -35,8 +35,9 @@ async def lifespan(app: FastAPI):
     llm_service.initialize()
     logger.info("LLM operations service started")
     yield
-    # Shutdown (if needed)
+    # Shutdown
     logger.info("LLM operations service shutting down")
+    await llm_service.close()
 
 
 # Create FastAPI app
@@ -55,5 +56,11 @@ app.include_router(health_router)
 app.include_router(llm_router)
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8003)
+    import asyncio
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+    # Serve with hypercorn, as in the container: the service clients speak
+    # HTTP/2 with prior knowledge, which uvicorn does not accept
+    config = Config()
+    config.bind = ["0.0.0.0:8003"]
+    asyncio.run(serve(app, config))
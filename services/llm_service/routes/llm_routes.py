@@ -3,14 +3,45 @@ import logging
 from typing import List, Dict, Any
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
-from services.llm_service import LLMService
+from services.llm_service import (
+    BatchPendingError,
+    LLMPermanentError,
+    LLMService,
+    LLMTransientError
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Seconds a client is asked to wait before repeating a request whose batch is still running
+BATCH_RETRY_AFTER = 30
+
+
+def error_status(error: Exception) -> int:
+    """HTTP status for a failed LLM operation.
+    
+    422 tells the client that repeating the request cannot help, 503 that it
+    may succeed later; anything unexpected is a 500.
+    """
+    if isinstance(error, LLMPermanentError):
+        return 422
+    if isinstance(error, LLMTransientError):
+        return 503
+    return 500
+
+
+def batch_pending_response(error: BatchPendingError) -> JSONResponse:
+    """Build the 202 response telling the client to repeat the request later."""
+    return JSONResponse(
+        status_code=202,
+        content={"status": "pending", "batch_id": error.batch_id},
+        headers={"Retry-After": str(BATCH_RETRY_AFTER)}
+    )
+
 
 # Pydantic models
 class ExtractRequest(BaseModel):
@@ -61,7 +92,8 @@ async def extract_elements(request: ExtractRequest):
         request: Request containing chunks to process
         
     Returns:
-        Dictionary with extracted elements
+        Dictionary with extracted elements, or a 202 response if the
+        elements are extracted by a batch job that is still running
     """
     try:
         elements = await llm_service.extract_elements(
@@ -72,9 +104,11 @@ async def extract_elements(request: ExtractRequest):
         )
         return {"elements": elements}
         
+    except BatchPendingError as e:
+        return batch_pending_response(e)
     except Exception as e:
         logger.exception("Error extracting elements")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=error_status(e), detail=str(e))
 
 
 @router.post("/summarize/elements")
@@ -85,7 +119,8 @@ async def summarize_elements(request: SummarizeElementsRequest):
         request: Request containing elements to summarize
         
     Returns:
-        Dictionary with summaries
+        Dictionary with summaries, or a 202 response if the elements are
+        summarized by a batch job that is still running
     """
     try:
         summaries = await llm_service.summarize_elements(
@@ -96,9 +131,11 @@ async def summarize_elements(request: SummarizeElementsRequest):
         )
         return {"summaries": summaries}
         
+    except BatchPendingError as e:
+        return batch_pending_response(e)
     except Exception as e:
         logger.exception("Error summarizing elements")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=error_status(e), detail=str(e))
 
 
 @router.post("/summarize/communities")
@@ -122,7 +159,7 @@ async def summarize_communities(request: SummarizeCommunitiesRequest):
         
     except Exception as e:
         logger.exception("Error summarizing communities")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=error_status(e), detail=str(e))
 
 
 @router.post("/query/answer")
@@ -147,7 +184,7 @@ async def answer_query(request: AnswerQueryRequest):
         
     except Exception as e:
         logger.exception("Error generating answers")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=error_status(e), detail=str(e))
 
 
 @router.post("/query/combine")
@@ -171,4 +208,4 @@ async def combine_answers(request: CombineAnswersRequest):
         
     except Exception as e:
         logger.exception("Error combining answers")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=error_status(e), detail=str(e))
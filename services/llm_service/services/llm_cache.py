@@ -0,0 +1,152 @@
+"""SQLite-backed cache of LLM responses."""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """Cache of chat completion responses keyed by a hash of the request.
+    
+    A completion is a function of its request parameters (model, messages,
+    temperature, max tokens), so identical requests are answered from the
+    cache instead of the API. Entries older than the TTL are ignored and
+    overwritten.
+    
+    The database runs in WAL mode so the service's worker processes can read
+    it concurrently. Each thread uses its own connection, as SQLite
+    connections cannot be shared across threads.
+    
+    It also records running Batch API jobs, so a repeated batch request
+    handled by any worker process attaches to the job already submitted.
+    """
+    
+    def __init__(self, path: str, ttl_seconds: float):
+        """Open the cache database, creating it if needed.
+        
+        Args:
+            path: Path of the SQLite database file.
+            ttl_seconds: How long cached responses stay valid.
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._local = threading.local()
+        
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "hash TEXT PRIMARY KEY, model TEXT, response TEXT, created_at INTEGER)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS batches ("
+            "batch_key TEXT PRIMARY KEY, batch_id TEXT, created_at INTEGER)"
+        )
+        connection.commit()
+        logger.info("LLM response cache opened at %s", path)
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection to the cache database."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Wait for a concurrent writer in another process rather than failing
+            connection = sqlite3.connect(self.path, timeout=30.0)
+            self._local.connection = connection
+        return connection
+    
+    @staticmethod
+    def request_hash(api_params: Dict[str, Any]) -> str:
+        """Compute the cache key of a chat completion request.
+        
+        Args:
+            api_params: Keyword arguments for ``chat.completions.create``.
+            
+        Returns:
+            str: SHA-256 hex digest of the canonical JSON encoding of the request.
+        """
+        encoded = json.dumps(api_params, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    
+    def get(self, api_params: Dict[str, Any]) -> Optional[str]:
+        """Look up the cached response to a request.
+        
+        Blocking; call through ``asyncio.to_thread`` from async code.
+        
+        Args:
+            api_params: Keyword arguments for ``chat.completions.create``.
+            
+        Returns:
+            Optional[str]: The cached response text, or None if there is no
+                valid entry.
+        """
+        row = self._connection().execute(
+            "SELECT response FROM cache WHERE hash = ? AND created_at >= ?",
+            (self.request_hash(api_params), int(time.time() - self.ttl_seconds))
+        ).fetchone()
+        return row[0] if row else None
+    
+    def put(self, api_params: Dict[str, Any], response: str):
+        """Store the response to a request.
+        
+        Blocking; call through ``asyncio.to_thread`` from async code.
+        
+        Args:
+            api_params: Keyword arguments for ``chat.completions.create``.
+            response: Response text to cache.
+        """
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO cache (hash, model, response, created_at) VALUES (?, ?, ?, ?)",
+            (self.request_hash(api_params), api_params["model"], response, int(time.time()))
+        )
+        connection.commit()
+    
+    def get_batch(self, batch_key: str) -> Optional[str]:
+        """Look up the running batch recorded under a key.
+        
+        Blocking; call through ``asyncio.to_thread`` from async code.
+        
+        Args:
+            batch_key: Key derived from the batch's requests.
+            
+        Returns:
+            Optional[str]: The batch ID, or None if no batch is recorded.
+        """
+        row = self._connection().execute(
+            "SELECT batch_id FROM batches WHERE batch_key = ?",
+            (batch_key,)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def put_batch(self, batch_key: str, batch_id: str):
+        """Record a running batch under a key.
+        
+        Blocking; call through ``asyncio.to_thread`` from async code.
+        
+        Args:
+            batch_key: Key derived from the batch's requests.
+            batch_id: ID of the submitted batch.
+        """
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO batches (batch_key, batch_id, created_at) VALUES (?, ?, ?)",
+            (batch_key, batch_id, int(time.time()))
+        )
+        connection.commit()
+    
+    def delete_batch(self, batch_key: str):
+        """Forget the batch recorded under a key.
+        
+        Blocking; call through ``asyncio.to_thread`` from async code.
+        
+        Args:
+            batch_key: Key derived from the batch's requests.
+        """
+        connection = self._connection()
+        connection.execute("DELETE FROM batches WHERE batch_key = ?", (batch_key,))
+        connection.commit()
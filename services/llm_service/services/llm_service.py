@@ -1,13 +1,122 @@
 """LLM operations business logic."""
+import json
 import logging
 import os
-from typing import List, Dict, Optional
+import time
+from typing import List, Dict, Optional, Any, Awaitable, Callable
 import asyncio
-from openai import AzureOpenAI
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    AsyncAzureOpenAI,
+    InternalServerError,
+    RateLimitError
+)
 import httpx
+from services.llm_cache import LLMResponseCache
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential
+)
 
 logger = logging.getLogger(__name__)
 
+# Azure OpenAI batch jobs target the chat completions endpoint without a /v1 prefix
+BATCH_ENDPOINT = "/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_TERMINAL_STATES = {"completed", "failed", "expired", "cancelled"}
+
+# Batch status polling backs off exponentially between these bounds (seconds)
+BATCH_POLL_INITIAL_INTERVAL = 5.0
+BATCH_POLL_MAX_INTERVAL = 300.0
+
+# How long a request waits for its batch before answering that it is still
+# running, kept well below the callers' HTTP timeouts (seconds)
+BATCH_REQUEST_WAIT = 120.0
+
+# Keep-alive and timeouts of the HTTP client behind the OpenAI client
+OPENAI_KEEPALIVE_EXPIRY = 90.0
+OPENAI_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# Longest intermediate answer passed on to the final-answer prompt, in characters
+MAX_CHARS_PER_ANSWER = 2000
+
+# Separator between intermediate answers in the final-answer prompt
+ANSWER_SEPARATOR = "\n\n---\n\n"
+
+# Attempts for a completion still rejected with 429 despite the proactive limits
+RATE_LIMITED_MAX_ATTEMPTS = 5
+
+# Attempts for each item of a parallel stage before the whole stage fails
+ITEM_MAX_ATTEMPTS = 3
+
+
+class LLMPermanentError(Exception):
+    """An LLM operation failed in a way that repeating it cannot fix.
+    
+    Raised for requests the API rejects (bad request, authentication, content
+    filter) and for items that still fail after all of their attempts.
+    """
+
+
+class LLMTransientError(Exception):
+    """An LLM operation failed in a way that may succeed if repeated later."""
+
+
+class BatchPendingError(Exception):
+    """A Batch API job has not finished within ``BATCH_REQUEST_WAIT``.
+    
+    Sending the same request again later attaches to the running job instead
+    of submitting a new one.
+    """
+    
+    def __init__(self, batch_id: str):
+        super().__init__(f"LLM batch {batch_id} is still running")
+        self.batch_id = batch_id
+
+
+class TokenBucket:
+    """Token bucket that paces callers to a steady rate within one process.
+    
+    Callers wait in turn for enough tokens instead of firing requests that
+    would be rejected, so bursts are smoothed rather than retried.
+    """
+    
+    def __init__(self, rate_per_second: float, capacity: float):
+        """Initialize a full bucket.
+        
+        Args:
+            rate_per_second: Tokens added per second.
+            capacity: Maximum number of tokens the bucket holds.
+        """
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, tokens: float = 1):
+        """Wait until the requested tokens are available and take them.
+        
+        Args:
+            tokens: Number of tokens to take.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.last_refill) * self.rate_per_second
+                )
+                self.last_refill = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) / self.rate_per_second)
+
 
 class LLMService:
     """Service for LLM API operations.
@@ -23,7 +132,7 @@ class LLMService:
         Raises:
             ValueError: If required environment variables are not set.
         """
-        self.client: Optional[AzureOpenAI] = None
+        self.client: Optional[AsyncAzureOpenAI] = None
         
         # Required environment variables - no defaults
         self.rate_limiter_url: str = os.getenv("RATE_LIMITER_URL")
@@ -38,6 +147,60 @@ class LLMService:
         self.rate_limit_bucket_id: str = os.getenv("RATE_LIMIT_BUCKET_ID")
         if not self.rate_limit_bucket_id:
             raise ValueError("RATE_LIMIT_BUCKET_ID environment variable is required")
+        
+        # Completion settings are read once here rather than on every request
+        self.model_name: str = os.getenv("OPENAI_INFERENCE_MODEL_NAME")
+        if not self.model_name:
+            raise ValueError("OPENAI_INFERENCE_MODEL_NAME environment variable is required")
+        
+        temperature_str = os.getenv("OPENAI_TEMPERATURE")
+        self.default_temperature: Optional[float] = float(temperature_str) if temperature_str else None
+        
+        max_tokens_str = os.getenv("OPENAI_MAX_TOKENS")
+        self.default_max_tokens: Optional[int] = int(max_tokens_str) if max_tokens_str else None
+        
+        # Indexing stages (extraction and element summaries) can be submitted as
+        # Batch API jobs, trading latency for cost and throughput; query-time
+        # stages always call the API directly
+        self.use_batch_api: bool = os.getenv("USE_BATCH_API", "false").lower() == "true"
+        
+        # Maximum number of API calls in flight at once; calls are network-bound,
+        # so this is sized well beyond the core count
+        self.max_workers: int = int(os.getenv("MAX_WORKERS", (os.cpu_count() or 1) * 5))
+        self.semaphore = asyncio.Semaphore(self.max_workers)
+        
+        # Persistent client for the rate limiter service, reused by every call.
+        # Calls wait at the limiter only while holding the semaphore, so one
+        # connection per worker is enough and callers never queue for the pool
+        self.rate_limiter_client = httpx.AsyncClient(
+            timeout=self.rate_limit_timeout + 5.0,
+            limits=httpx.Limits(
+                max_connections=self.max_workers,
+                max_keepalive_connections=self.max_workers
+            )
+        )
+        
+        # Optional requests-per-minute limit, applied per worker process; token
+        # usage is limited separately through the shared rate limiter service
+        requests_per_minute_str = os.getenv("OPENAI_REQUESTS_PER_MINUTE")
+        self.request_bucket: Optional[TokenBucket] = None
+        if requests_per_minute_str:
+            requests_per_second = float(requests_per_minute_str) / 60.0
+            self.request_bucket = TokenBucket(requests_per_second, capacity=max(1.0, requests_per_second))
+        
+        # Batch jobs still running, by batch key; used when there is no response
+        # cache to record them in, so they are only shared within this process
+        self.inflight_batches: Dict[str, str] = {}
+        
+        # Optional cache of indexing-stage completions, so chunks that were already
+        # extracted and summarized are not paid for again
+        self.response_cache: Optional[LLMResponseCache] = None
+        if os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true":
+            ttl_days = float(os.getenv("LLM_CACHE_TTL_DAYS", "7"))
+            self.response_cache = LLMResponseCache(
+                os.getenv("LLM_CACHE_PATH", "llm_cache.db"),
+                ttl_seconds=ttl_days * 24 * 60 * 60
+            )
     
     def initialize(self):
         """Initialize Azure OpenAI client.
@@ -68,12 +231,33 @@ class LLMService:
             else:
                 azure_endpoint = base_url if base_url.endswith("/") else base_url + "/"
             
-            self.client = AzureOpenAI(
+            # One pooled HTTP client for all API calls, so connections and TLS
+            # sessions are kept alive between requests; sized so that every
+            # call in flight can hold a connection. HTTP/2 is negotiated over
+            # TLS, multiplexing concurrent calls over a few connections
+            http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_workers,
+                    max_keepalive_connections=self.max_workers,
+                    keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY
+                ),
+                timeout=OPENAI_TIMEOUT
+            )
+            self.client = AsyncAzureOpenAI(
                 api_version=api_version,
                 azure_endpoint=azure_endpoint,
                 api_key=api_key,
+                http_client=http_client,
             )
-            logger.info(f"Azure OpenAI client initialized with endpoint: {azure_endpoint}, api_version: {api_version}")
+            logger.info("Azure OpenAI client initialized with endpoint: %s, api_version: %s", azure_endpoint, api_version)
+    
+    async def close(self):
+        """Close the Azure OpenAI client and the rate limiter client."""
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+        await self.rate_limiter_client.aclose()
     
     @staticmethod
     def estimate_tokens(text: str) -> int:
@@ -125,34 +309,83 @@ class LLMService:
         if bucket_id is None:
             bucket_id = self.rate_limit_bucket_id
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.rate_limiter_url}/tokens/consume",
-                    json={
-                        "tokens": tokens,
-                        "bucket_id": bucket_id,
-                        "timeout": self.rate_limit_timeout
-                    },
-                    timeout=self.rate_limit_timeout + 5.0
-                )
-                if response.status_code == 429:
-                    raise Exception("Rate limit exceeded")
-                response.raise_for_status()
-                return response.json()
-            except httpx.RequestError as e:
-                logger.exception("Rate limiter request error")
-                logger.warning(
-                    "Rate limiter unavailable, proceeding without rate limiting"
-                )
-                return {"status": "bypassed"}
+        try:
+            response = await self.rate_limiter_client.post(
+                f"{self.rate_limiter_url}/tokens/consume",
+                json={
+                    "tokens": tokens,
+                    "bucket_id": bucket_id,
+                    "timeout": self.rate_limit_timeout
+                }
+            )
+            if response.status_code == 429:
+                raise LLMTransientError("Rate limit exceeded")
+            response.raise_for_status()
+            return response.json()
+        except httpx.PoolTimeout:
+            # Local congestion, not an unavailable limiter; never skip rate limiting for it
+            raise
+        except httpx.RequestError as e:
+            logger.exception("Rate limiter request error")
+            logger.warning(
+                "Rate limiter unavailable, proceeding without rate limiting"
+            )
+            return {"status": "bypassed"}
+    
+    def _completion_params(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = None,
+        max_tokens: int = None
+    ) -> Dict[str, Any]:
+        """Build chat completion parameters for a request.
+        
+        Args:
+            messages: List of message dictionaries for the API.
+            temperature: Sampling temperature (uses env var if not provided).
+            max_tokens: Maximum tokens to generate (uses env var if not provided).
+            
+        Returns:
+            Dict[str, Any]: Keyword arguments for ``chat.completions.create``.
+        """
+        # Use provided values or fall back to environment variables
+        if temperature is None:
+            temperature = self.default_temperature
+        
+        if max_tokens is None:
+            max_tokens = self.default_max_tokens
+        
+        api_params = {
+            "model": self.model_name,
+            "messages": messages
+        }
+        
+        # Add optional parameters if provided
+        if temperature is not None:
+            api_params["temperature"] = temperature
+        if max_tokens is not None:
+            api_params["max_tokens"] = max_tokens
+        
+        return api_params
+    
+    @retry(
+        retry=retry_if_exception_type(RateLimitError),
+        wait=wait_random_exponential(multiplier=1, max=60),
+        stop=stop_after_attempt(RATE_LIMITED_MAX_ATTEMPTS),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+    async def _create_completion(self, api_params: Dict[str, Any]):
+        """Create a chat completion, backing off on 429."""
+        return await self.client.chat.completions.create(**api_params)
     
     async def call_llm_api(
         self,
         messages: List[Dict[str, str]],
         request_type: str = "",
         temperature: float = None,
-        max_tokens: int = None
+        max_tokens: int = None,
+        use_cache: bool = False
     ) -> str:
         """Make a rate-limited LLM API call.
         
@@ -161,6 +394,7 @@ class LLMService:
             request_type: Description of the request type for logging.
             temperature: Sampling temperature (uses env var if not provided).
             max_tokens: Maximum tokens to generate (uses env var if not provided).
+            use_cache: Answer from and store into the response cache, if enabled.
             
         Returns:
             str: LLM response text.
@@ -172,49 +406,257 @@ class LLMService:
         if self.client is None:
             self.initialize()
         
-        model_name = os.getenv("OPENAI_INFERENCE_MODEL_NAME")
-        if not model_name:
-            raise ValueError("OPENAI_INFERENCE_MODEL_NAME environment variable is required")
+        api_params = self._completion_params(messages, temperature, max_tokens)
         
-        # Use provided values or fall back to environment variables
-        if temperature is None:
-            temperature_str = os.getenv("OPENAI_TEMPERATURE")
-            temperature = float(temperature_str) if temperature_str else None
-        
-        if max_tokens is None:
-            max_tokens_str = os.getenv("OPENAI_MAX_TOKENS")
-            max_tokens = int(max_tokens_str) if max_tokens_str else None
+        cache = self.response_cache if use_cache else None
+        if cache is not None:
+            cached = await asyncio.to_thread(cache.get, api_params)
+            if cached is not None:
+                logger.debug("API Request [%s] - Served from cache", request_type)
+                return cached
         
         # Estimate tokens for rate limiting
         estimated_tokens = self.estimate_messages_tokens(messages)
-        logger.debug(
-            f"API Request [{request_type}] - Estimated tokens: {estimated_tokens}"
-        )
+        logger.debug("API Request [%s] - Estimated tokens: %d", request_type, estimated_tokens)
+        
+        # At most MAX_WORKERS calls wait for rate limit capacity or the API at
+        # once; tokens are consumed only when the call can go out
+        async with self.semaphore:
+            await self.consume_rate_limit(estimated_tokens)
+            if self.request_bucket is not None:
+                await self.request_bucket.acquire()
+            
+            try:
+                response = await self._create_completion(api_params)
+            except (RateLimitError, APIConnectionError, InternalServerError) as e:
+                logger.exception("API Request [%s] failed", request_type)
+                raise LLMTransientError(f"LLM API error: {str(e)}") from e
+            except APIStatusError as e:
+                # Any other status means the API rejected the request itself
+                logger.exception("API Request [%s] rejected", request_type)
+                raise LLMPermanentError(f"LLM API error: {str(e)}") from e
+            except Exception as e:
+                logger.exception("API Request [%s] failed", request_type)
+                raise Exception(f"LLM API error: {str(e)}")
+        
+        logger.info("API Response [%s] - Status: Success", request_type)
+        content = response.choices[0].message.content
+        if cache is not None and content is not None:
+            await asyncio.to_thread(cache.put, api_params, content)
+        return content
+    
+    async def submit_batch(
+        self,
+        requests: List[List[Dict[str, str]]],
+        request_type: str,
+        temperature: float = None,
+        max_tokens: int = None
+    ) -> List[str]:
+        """Run chat completions as a single Batch API job.
         
-        # Wait for rate limit capacity
-        await self.consume_rate_limit(estimated_tokens)
+        The requests are uploaded as one JSONL file, the batch is polled with
+        exponential backoff until it reaches a terminal state, and the output
+        file is parsed back into the order of the input. Requests found in
+        the response cache are answered from it and left out of the batch.
         
-        try:
-            # Build API call parameters
-            api_params = {
-                "model": model_name,
-                "messages": messages
-            }
+        A running batch is recorded under a key derived from its requests, so
+        the same requests sent again (after ``BatchPendingError`` or a
+        client-side retry) attach to that batch instead of paying for a new one.
+        
+        Args:
+            requests: Message lists, one per completion.
+            request_type: Prefix for each request's ``custom_id``.
+            temperature: Sampling temperature.
+            max_tokens: Maximum tokens to generate.
+            
+        Returns:
+            List[str]: Response texts, in the same order as ``requests``.
+            
+        Raises:
+            BatchPendingError: If the batch is still running after ``BATCH_REQUEST_WAIT``.
+            Exception: If the batch job or any of its requests fails.
+        """
+        if not requests:
+            return []
+        
+        if self.client is None:
+            self.initialize()
+        
+        params = [self._completion_params(messages, temperature, max_tokens) for messages in requests]
+        results: List[Optional[str]] = [None] * len(requests)
+        if self.response_cache is not None:
+            results = await asyncio.to_thread(
+                lambda: [self.response_cache.get(api_params) for api_params in params]
+            )
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            logger.info("All %d [%s] requests served from cache", len(requests), request_type)
+            return results
+        
+        # The custom IDs depend on the request positions, so they are part of the key
+        batch_key = LLMResponseCache.request_hash({
+            "request_type": request_type,
+            "requests": [[i, LLMResponseCache.request_hash(params[i])] for i in pending]
+        })
+        
+        batch = None
+        batch_id = await self._get_inflight_batch(batch_key)
+        if batch_id is not None:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status in BATCH_TERMINAL_STATES and batch.status != "completed":
+                logger.warning("Resubmitting batch %s [%s], which ended with status %s", batch.id, request_type, batch.status)
+                batch = None
+            else:
+                logger.info("Attached to running batch %s [%s]", batch.id, request_type)
+        
+        if batch is None:
+            lines = [
+                json.dumps({
+                    "custom_id": f"{request_type}_{i}",
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": params[i]
+                })
+                for i in pending
+            ]
+            batch_file = await self.client.files.create(
+                file=(f"{request_type}.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
+            )
+            batch = await self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint=BATCH_ENDPOINT,
+                completion_window=BATCH_COMPLETION_WINDOW
+            )
+            await self._set_inflight_batch(batch_key, batch.id)
+            logger.info("Submitted batch %s [%s] with %d requests", batch.id, request_type, len(pending))
+        
+        deadline = time.monotonic() + BATCH_REQUEST_WAIT
+        interval = BATCH_POLL_INITIAL_INTERVAL
+        while batch.status not in BATCH_TERMINAL_STATES:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise BatchPendingError(batch.id)
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * 2, BATCH_POLL_MAX_INTERVAL)
+            batch = await self.client.batches.retrieve(batch.id)
+            logger.debug("Batch %s [%s] status: %s", batch.id, request_type, batch.status)
+        
+        await self._delete_inflight_batch(batch_key)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            message = f"LLM batch {batch.id} [{request_type}] ended with status {batch.status}"
+            # A failed batch did not pass validation; expired and cancelled ones can be resubmitted
+            if batch.status == "failed":
+                raise LLMPermanentError(message)
+            raise LLMTransientError(message)
+        
+        output = await self.client.files.content(batch.output_file_id)
+        outputs: Dict[str, str] = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            status_code = response.get("status_code")
+            if record.get("error") or status_code != 200:
+                message = f"LLM batch request {record['custom_id']} failed: {record.get('error') or response}"
+                if status_code == 429 or (status_code or 0) >= 500:
+                    raise LLMTransientError(message)
+                raise LLMPermanentError(message)
+            outputs[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        
+        for i in pending:
+            results[i] = outputs[f"{request_type}_{i}"]
+        if self.response_cache is not None:
+            await asyncio.to_thread(
+                lambda: [self.response_cache.put(params[i], results[i]) for i in pending]
+            )
+        
+        logger.info("Batch %s [%s] completed", batch.id, request_type)
+        return results
+    
+    async def _get_inflight_batch(self, batch_key: str) -> Optional[str]:
+        """Return the ID of the running batch recorded under a key, if any."""
+        if self.response_cache is not None:
+            return await asyncio.to_thread(self.response_cache.get_batch, batch_key)
+        return self.inflight_batches.get(batch_key)
+    
+    async def _set_inflight_batch(self, batch_key: str, batch_id: str):
+        """Record a running batch under its key."""
+        if self.response_cache is not None:
+            await asyncio.to_thread(self.response_cache.put_batch, batch_key, batch_id)
+        else:
+            self.inflight_batches[batch_key] = batch_id
+    
+    async def _delete_inflight_batch(self, batch_key: str):
+        """Forget a batch that has reached a terminal state."""
+        if self.response_cache is not None:
+            await asyncio.to_thread(self.response_cache.delete_batch, batch_key)
+        else:
+            self.inflight_batches.pop(batch_key, None)
+    
+    async def gather_with_retries(
+        self,
+        process: Callable[[int, Any], Awaitable[str]],
+        items: List[Any],
+        request_type: str
+    ) -> List[str]:
+        """Process items concurrently, retrying only the items that failed.
+        
+        A failing item does not discard the results of the others: failures are
+        logged, and only the failed items are run again, up to ITEM_MAX_ATTEMPTS
+        times in total. If any item still fails, the stage fails as a whole, so
+        no partial result is returned (and stored by the caller) as if complete.
+        Items the API rejects (``LLMPermanentError``) fail the stage without
+        being retried.
+        
+        Args:
+            process: Coroutine function called with the index and the item.
+            items: Items to process.
+            request_type: Description of the stage for logging.
             
-            # Add optional parameters if provided
-            if temperature is not None:
-                api_params["temperature"] = temperature
-            if max_tokens is not None:
-                api_params["max_tokens"] = max_tokens
+        Returns:
+            List[str]: Results in the same order as ``items``.
             
-            response = self.client.chat.completions.create(**api_params)
+        Raises:
+            LLMPermanentError: If an item is rejected or fails on every attempt.
+        """
+        results: List[Optional[str]] = [None] * len(items)
+        pending = list(range(len(items)))
+        last_error: Optional[BaseException] = None
+        
+        for attempt in range(1, ITEM_MAX_ATTEMPTS + 1):
+            outcomes = await asyncio.gather(
+                *(process(i, items[i]) for i in pending),
+                return_exceptions=True
+            )
             
-            logger.info(f"API Response [{request_type}] - Status: Success")
-            return response.choices[0].message.content
+            failed = []
+            for i, outcome in zip(pending, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.warning(
+                        "[%s] item %d failed (attempt %d/%d): %s",
+                        request_type, i, attempt, ITEM_MAX_ATTEMPTS, outcome
+                    )
+                    failed.append(i)
+                    last_error = outcome
+                    if isinstance(outcome, LLMPermanentError):
+                        raise LLMPermanentError(f"[{request_type}] item {i} was rejected: {outcome}") from outcome
+                else:
+                    results[i] = outcome
             
-        except Exception as e:
-            logger.exception(f"API Request [{request_type}] failed")
-            raise Exception(f"LLM API error: {str(e)}")
+            pending = failed
+            if not pending:
+                break
+        
+        if pending:
+            raise LLMPermanentError(
+                f"[{request_type}] {len(pending)} of {len(items)} items failed "
+                f"after {ITEM_MAX_ATTEMPTS} attempts: {last_error}"
+            ) from last_error
+        
+        return results
     
     async def extract_elements(
         self,
@@ -234,7 +676,7 @@ class LLMService:
         Returns:
             List[str]: List of extracted elements, one per chunk.
         """
-        logger.info(f"Extracting elements from {len(chunks)} chunks")
+        logger.info("Extracting elements from %d chunks", len(chunks))
         
         if system_prompt is None:
             system_prompt = os.getenv(
@@ -242,6 +684,12 @@ class LLMService:
                 "Extract entities and relationships from the following text."
             )
         
+        # Identical chunks (shared headers, footers, boilerplate) are extracted
+        # once and the result is reused for every occurrence
+        unique_chunks = list(dict.fromkeys(chunks))
+        if len(unique_chunks) < len(chunks):
+            logger.info("Extracting %d unique chunks of %d", len(unique_chunks), len(chunks))
+        
         # Process chunks in parallel
         
         async def process_chunk(i: int, chunk: str) -> str:
@@ -259,13 +707,28 @@ class LLMService:
                 messages,
                 f"extract_chunk_{i}",
                 temperature=temperature,
-                max_tokens=max_tokens
+                max_tokens=max_tokens,
+                use_cache=True
             )
         
-        tasks = [process_chunk(i, chunk) for i, chunk in enumerate(chunks)]
-        elements = await asyncio.gather(*tasks)
+        if self.use_batch_api:
+            unique_elements = await self.submit_batch(
+                [
+                    [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": chunk}
+                    ]
+                    for chunk in unique_chunks
+                ],
+                "extract_chunk",
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+        else:
+            unique_elements = await self.gather_with_retries(process_chunk, unique_chunks, "extract_chunk")
         
-        return list(elements)
+        element_by_chunk = dict(zip(unique_chunks, unique_elements))
+        return [element_by_chunk[chunk] for chunk in chunks]
     
     async def summarize_elements(
         self,
@@ -285,7 +748,7 @@ class LLMService:
         Returns:
             List[str]: List of summaries, one per element.
         """
-        logger.info(f"Summarizing {len(elements)} elements")
+        logger.info("Summarizing %d elements", len(elements))
         
         if system_prompt is None:
             system_prompt = os.getenv(
@@ -309,6 +772,20 @@ Guidelines:
 - Include only factual information from the input"""
             )
         
+        if self.use_batch_api:
+            return await self.submit_batch(
+                [
+                    [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": element}
+                    ]
+                    for element in elements
+                ],
+                "summarize_element",
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+        
         # Process elements in parallel
         import asyncio
         
@@ -327,13 +804,11 @@ Guidelines:
                 messages,
                 f"summarize_element_{i}",
                 temperature=temperature,
-                max_tokens=max_tokens
+                max_tokens=max_tokens,
+                use_cache=True
             )
         
-        tasks = [process_element(i, element) for i, element in enumerate(elements)]
-        summaries = await asyncio.gather(*tasks)
-        
-        return list(summaries)
+        return await self.gather_with_retries(process_element, elements, "summarize_element")
     
     async def summarize_communities(
         self,
@@ -353,7 +828,7 @@ Guidelines:
         Returns:
             List[str]: List of community summaries.
         """
-        logger.info(f"Summarizing {len(descriptions)} communities")
+        logger.info("Summarizing %d communities", len(descriptions))
         
         if system_prompt is None:
             system_prompt = os.getenv(
@@ -390,10 +865,7 @@ Guidelines:
                 max_tokens=max_tokens
             )
         
-        tasks = [process_community(i, description) for i, description in enumerate(descriptions)]
-        summaries = await asyncio.gather(*tasks)
-        
-        return list(summaries)
+        return await self.gather_with_retries(process_community, descriptions, "summarize_community")
     
     async def answer_query(
         self,
@@ -415,7 +887,7 @@ Guidelines:
         Returns:
             List[str]: List of intermediate answers, one per summary.
         """
-        logger.info(f"Generating answers from {len(summaries)} summaries")
+        logger.info("Generating answers from %d summaries", len(summaries))
         
         if system_prompt is None:
             system_prompt = os.getenv(
@@ -444,10 +916,7 @@ Guidelines:
                 max_tokens=max_tokens
             )
         
-        tasks = [process_summary(i, summary) for i, summary in enumerate(summaries)]
-        answers = await asyncio.gather(*tasks)
-        
-        return list(answers)
+        return await self.gather_with_retries(process_summary, summaries, "answer_community")
     
     async def combine_answers(
         self,
@@ -482,7 +951,10 @@ Guidelines:
             },
             {
                 "role": "user",
-                "content": f"Intermediate answers: {intermediate_answers}"
+                # Plain text rather than the repr of a list, with each answer capped
+                # so many communities cannot blow up the prompt
+                "content": "Combine these intermediate answers into a final concise response:\n\n"
+                + ANSWER_SEPARATOR.join(answer[:MAX_CHARS_PER_ANSWER] for answer in intermediate_answers)
             }
         ]
         
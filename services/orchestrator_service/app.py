@@ -4,9 +4,10 @@ import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from routes.orchestrator_routes import router as orchestrator_router
+from routes.orchestrator_routes import router as orchestrator_router, ws_router, orchestrator_service
 from routes.health_routes import router as health_router
 from middleware import SecurityHeadersMiddleware
 
@@ -24,7 +25,7 @@ async def lifespan(app: FastAPI):
     """Manage application lifespan.
     
     Handles initialization and shutdown of the orchestrator service,
-    logging startup and shutdown events.
+    including the indexing job queue connection and service clients.
     
     Args:
         app: FastAPI application instance.
@@ -33,10 +34,12 @@ async def lifespan(app: FastAPI):
         None: Control to the application during its lifetime.
     """
     # Startup
+    await orchestrator_service.connect()
     logger.info("Orchestrator service started and ready to accept requests")
     yield
-    # Shutdown (if needed)
+    # Shutdown
     logger.info("Orchestrator service shutting down")
+    await orchestrator_service.close()
 
 
 # Create FastAPI app
@@ -44,6 +47,7 @@ app = FastAPI(
     title="Graph RAG Orchestrator Service",
     description="Orchestrates the Graph RAG pipeline for document indexing and querying",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -62,7 +66,18 @@ app.add_middleware(SecurityHeadersMiddleware)
 # Include routers
 app.include_router(health_router)
 app.include_router(orchestrator_router)
+app.include_router(ws_router)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    from config import get_settings
+    # Pre-fork one process per worker; all job state lives in Redis, so any
+    # process can report on jobs enqueued through another
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=get_settings().api_workers,
+        loop="uvloop",
+        http="httptools"
+    )
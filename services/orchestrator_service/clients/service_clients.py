@@ -1,223 +1,397 @@
 """HTTP clients for microservices."""
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 import httpx
+from cachetools import TTLCache
+import msgpack
+import orjson
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter
+)
 
 logger = logging.getLogger(__name__)
 
+# Connection failures are retried by the transport before a request is sent
+TRANSPORT_RETRIES = 3
 
-class CacheServiceClient:
-    """Client for cache microservice."""
+# Total attempts for a request that keeps failing with a retryable error (see _is_transient_error)
+MAX_ATTEMPTS = 5
+
+# Connection pool limits of the HTTP client shared by all service clients
+MAX_CONNECTIONS = 128
+MAX_KEEPALIVE_CONNECTIONS = 32
+
+# Requests in flight to a single downstream service at once; HTTP/2 multiplexes
+# them over one connection, so the pool limits alone do not bound this
+MAX_REQUESTS_PER_SERVICE = 64
+
+# Request headers for JSON bodies serialized with orjson
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Fallback delay before repeating a request whose LLM batch job is still running
+BATCH_RETRY_AFTER = 30.0
+
+# In-process (L1) cache for query-answer reads, which are keyed by content hashes
+L1_CACHE_MAXSIZE = 4096
+L1_CACHE_TTL = 60.0
+
+
+# Transport errors raised before the request reached the service
+UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Statuses meaning the service could not handle a POST right now; any other
+# 5xx may follow work (and LLM spend) that a retry would repeat
+RETRYABLE_POST_STATUSES = {502, 503, 504}
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """Decide whether a failed request is retried.
+    
+    Requests that never reached the service are always retried; a 4xx means
+    the request itself is wrong and is never retried. GETs are also retried
+    on other transport errors and any 5xx. POSTs, which may have run
+    expensive LLM stages downstream, are retried only on 502, 503 and 504.
+    """
+    if isinstance(exc, UNSENT_REQUEST_ERRORS):
+        return True
+    if isinstance(exc, httpx.TransportError):
+        try:
+            return exc.request.method == "GET"
+        except RuntimeError:
+            # No request attached, so it was never sent
+            return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        if exc.request.method == "GET":
+            return status >= 500
+        return status in RETRYABLE_POST_STATUSES
+    return False
+
+
+# Jittered backoff spreads the retries of a burst of failed requests over time
+# instead of sending them back to the downstream service all at once
+retry_on_transient_error = retry(
+    retry=retry_if_exception(_is_transient_error),
+    wait=wait_exponential_jitter(initial=0.1, max=5.0),
+    stop=stop_after_attempt(MAX_ATTEMPTS),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP client that can be shared by several service clients.
+    
+    Services are reached over plain http://, where HTTP/2 cannot be negotiated,
+    so the client speaks HTTP/2 with prior knowledge; every downstream service
+    runs under hypercorn, which accepts it (uvicorn does not, so the services'
+    ``python app.py`` entrypoints start hypercorn as well). Requests to one
+    service are then multiplexed over a single connection. Timeouts are set
+    per request by each service client.
+    
+    As each client process holds a single connection per service, all of its
+    requests to a multi-worker service (the LLM service runs 4 hypercorn
+    workers) are served by one of those workers. Load spreads across the
+    workers only by the number of client processes: the orchestrator's API
+    workers, its indexing workers and the graph processor.
+    """
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+    )
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            retries=TRANSPORT_RETRIES,
+            http1=False,
+            http2=True,
+            limits=limits
+        )
+    )
+
+
+class BaseServiceClient:
+    """Base HTTP client for a downstream microservice.
+    
+    Uses a persistent HTTP client, either shared with other service clients
+    or created on first use, and retries transient failures so a single
+    overloaded downstream does not fail a whole pipeline run. At most
+    ``MAX_REQUESTS_PER_SERVICE`` requests are in flight to the service at
+    once; further requests wait for a free slot.
+    
+    Subclasses list their fixed endpoints in ``ENDPOINTS``; these are parsed
+    into ``httpx.URL`` objects once instead of on every call.
+    """
+    
+    ENDPOINTS: Dict[str, str] = {}
     
-    def __init__(self, base_url):
+    def __init__(self, base_url: str, timeout: float, client: Optional[httpx.AsyncClient] = None):
         self.base_url = base_url
-        self.timeout = 30.0
-        self._client = None
+        self.timeout = timeout
+        self._client = client
+        # A shared client is closed by its owner, not by this service client
+        self._owns_client = client is None
+        self._slots = asyncio.Semaphore(MAX_REQUESTS_PER_SERVICE)
+        self._urls: Dict[str, httpx.URL] = {
+            name: httpx.URL(f"{base_url}{path}") for name, path in self.ENDPOINTS.items()
+        }
     
     async def _get_client(self):
         """Get or create persistent HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = create_http_client()
         return self._client
     
     async def close(self):
-        """Close the HTTP client."""
-        if self._client is not None:
+        """Close the HTTP client if this service client created it."""
+        if self._owns_client and self._client is not None:
             await self._client.aclose()
             self._client = None
     
-    async def check_document_cached(self, file_path: str, content: str) -> Dict[str, Any]:
-        """Check if document is cached."""
+    @retry_on_transient_error
+    async def _request(self, method: str, url: Union[str, httpx.URL], **kwargs) -> httpx.Response:
+        """Send a request, retrying transient failures with exponential backoff and jitter."""
         client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/documents/check",
-            json={"file_path": file_path, "content": content}
-        )
+        kwargs.setdefault("timeout", self.timeout)
+        async with self._slots:
+            response = await client.request(method, url, **kwargs)
         response.raise_for_status()
-        return response.json()
+        return response
+    
+    async def _post_json(self, url: Union[str, httpx.URL], payload: Dict[str, Any], **kwargs) -> Any:
+        """POST a JSON payload and return the decoded JSON response.
+        
+        Bodies are encoded and decoded with orjson, which is considerably
+        faster than the stdlib json module httpx uses for ``json=``.
+        """
+        response = await self._request(
+            "POST", url, content=orjson.dumps(payload), headers=JSON_HEADERS, **kwargs
+        )
+        return orjson.loads(response.content)
+    
+    async def _get_json(self, url: Union[str, httpx.URL]) -> Any:
+        """GET a URL and return the decoded JSON response."""
+        response = await self._request("GET", url)
+        return orjson.loads(response.content)
+    
+    @retry_on_transient_error
+    async def _get_large_json(self, url: Union[str, httpx.URL]) -> Any:
+        """GET a potentially large JSON body.
+        
+        The body is streamed into raw bytes and parsed with orjson, skipping
+        the intermediate text decoding and the slower stdlib parser.
+        """
+        client = await self._get_client()
+        async with self._slots, client.stream("GET", url, timeout=self.timeout) as response:
+            response.raise_for_status()
+            return orjson.loads(await response.aread())
+    
+    async def _get_json_or_none(self, url: Union[str, httpx.URL], large: bool = False) -> Optional[Any]:
+        """GET a URL and return the decoded JSON response, or None on 404."""
+        try:
+            if large:
+                return await self._get_large_json(url)
+            return await self._get_json(url)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+
+class CacheServiceClient(BaseServiceClient):
+    """Client for cache microservice.
+    
+    Query-answer reads are pure functions of their hash, so hits are kept in
+    a short-lived in-process L1 cache to skip the round trip when the same
+    query is asked again. Graph and community reads are not: the pipeline
+    uses them to decide whether to build and save, so they must see a cache
+    cleared through /admin/clear-all straight away.
+    """
+    
+    ENDPOINTS = {
+        "documents-check": "/documents/check",
+        "documents": "/documents",
+        "chunks": "/chunks",
+        "elements": "/elements",
+        "summaries": "/summaries",
+        "graph": "/graph",
+        "community-descriptions": "/community-descriptions",
+        "community-summaries": "/community-summaries",
+        "query-answers": "/query-answers"
+    }
+    
+    def __init__(self, base_url: str, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(base_url, timeout=30.0, client=client)
+        self._l1 = TTLCache(maxsize=L1_CACHE_MAXSIZE, ttl=L1_CACHE_TTL)
+        # Prefixes for per-key reads, so building each URL is a single concatenation
+        self._prefixes: Dict[str, str] = {
+            name: f"{base_url}{path}/" for name, path in self.ENDPOINTS.items()
+        }
+    
+    def _l1_get(self, kind: str, key: str) -> Optional[Any]:
+        """Return an L1-cached read result, or None on a miss."""
+        return self._l1.get((kind, key))
+    
+    def _l1_put(self, kind: str, key: str, value: Optional[Any]):
+        """Store a read result in L1; misses are not cached."""
+        if value is not None:
+            self._l1[(kind, key)] = value
+    
+    def _l1_invalidate(self, kind: str, key: str):
+        """Drop an L1 entry after the matching value has been saved."""
+        self._l1.pop((kind, key), None)
+    
+    async def check_document_cached(self, file_path: str, content_hash: str) -> Dict[str, Any]:
+        """Check if document is cached by its content hash."""
+        return await self._post_json(
+            self._urls["documents-check"],
+            {"file_path": file_path, "content_hash": content_hash}
+        )
     
     async def save_document(self, document_id: str, file_path: str, content: str, metadata: Optional[Dict] = None):
         """Save document."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/documents",
-            json={
+        return await self._post_json(
+            self._urls["documents"],
+            {
                 "document_id": document_id,
                 "file_path": file_path,
                 "content": content,
                 "metadata": metadata
             }
         )
-        response.raise_for_status()
-        return response.json()
     
     async def save_chunks(self, document_id: str, chunks: List[Dict]):
         """Save chunks."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/chunks",
-            json={"document_id": document_id, "chunks": chunks}
+        return await self._post_json(
+            self._urls["chunks"],
+            {"document_id": document_id, "chunks": chunks}
         )
-        response.raise_for_status()
-        return response.json()
     
     async def get_chunks(self, document_id: str) -> List[Dict]:
         """Get chunks."""
-        client = await self._get_client()
-        response = await client.get(f"{self.base_url}/chunks/{document_id}")
-        response.raise_for_status()
-        return response.json()["chunks"]
+        data = await self._get_large_json(self._prefixes["chunks"] + document_id)
+        return data["chunks"]
     
-    async def save_elements(self, document_id: str, elements: List[Dict]):
-        """Save elements."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/elements",
-            json={"document_id": document_id, "elements": elements}
+    async def save_elements(self, document_id: str, elements: List[str]):
+        """Save elements.
+        
+        Elements are sent as a msgpack-encoded structure of arrays; the
+        chunk index of each element is implied by its position.
+        """
+        response = await self._request(
+            "POST",
+            self._urls["elements"],
+            content=msgpack.packb(
+                {"document_id": document_id, "contents": elements},
+                use_bin_type=True
+            ),
+            headers={"content-type": "application/msgpack"}
         )
-        response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     
-    async def save_summaries(self, document_id: str, summaries: List[Dict]):
-        """Save summaries."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/summaries",
-            json={"document_id": document_id, "summaries": summaries}
+    async def save_summaries(self, document_id: str, summaries: List[str]):
+        """Save summaries.
+        
+        Summaries are sent as a msgpack-encoded structure of arrays; the
+        element index of each summary is implied by its position.
+        """
+        response = await self._request(
+            "POST",
+            self._urls["summaries"],
+            content=msgpack.packb(
+                {"document_id": document_id, "contents": summaries},
+                use_bin_type=True
+            ),
+            headers={"content-type": "application/msgpack"}
         )
-        response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     
     async def get_summaries(self, document_id: str) -> List[Dict]:
         """Get summaries."""
-        client = await self._get_client()
-        response = await client.get(f"{self.base_url}/summaries/{document_id}")
-        response.raise_for_status()
-        return response.json()["summaries"]
+        data = await self._get_large_json(self._prefixes["summaries"] + document_id)
+        return data["summaries"]
     
     async def save_graph(self, summaries_hash: str, nodes: int, edges: int, communities: List[Dict]):
         """Save graph structure and communities."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/graph",
-            json={
+        return await self._post_json(
+            self._urls["graph"],
+            {
                 "summaries_hash": summaries_hash,
                 "nodes": nodes,
                 "edges": edges,
                 "communities": communities
             }
         )
-        response.raise_for_status()
-        return response.json()
     
     async def get_graph(self, summaries_hash: str) -> Optional[Dict[str, Any]]:
         """Get cached graph structure."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"{self.base_url}/graph/{summaries_hash}")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return None
-            raise
+        return await self._get_json_or_none(self._prefixes["graph"] + summaries_hash)
     
     async def save_community_descriptions(self, summaries_hash: str, descriptions: List[Dict]):
         """Save community descriptions."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/community-descriptions",
-            json={
+        return await self._post_json(
+            self._urls["community-descriptions"],
+            {
                 "summaries_hash": summaries_hash,
                 "descriptions": descriptions
             }
         )
-        response.raise_for_status()
-        return response.json()
     
     async def get_community_descriptions(self, summaries_hash: str) -> Optional[List[Dict]]:
         """Get cached community descriptions."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"{self.base_url}/community-descriptions/{summaries_hash}")
-            response.raise_for_status()
-            return response.json()["descriptions"]
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return None
-            raise
+        data = await self._get_json_or_none(self._prefixes["community-descriptions"] + summaries_hash)
+        return data["descriptions"] if data is not None else None
     
     async def save_community_summaries(self, summaries_hash: str, summaries: List[str]):
         """Save community summaries."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/community-summaries",
-            json={
+        return await self._post_json(
+            self._urls["community-summaries"],
+            {
                 "summaries_hash": summaries_hash,
                 "summaries": summaries
             }
         )
-        response.raise_for_status()
-        return response.json()
     
     async def get_community_summaries(self, summaries_hash: str) -> Optional[List[str]]:
         """Get cached community summaries."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"{self.base_url}/community-summaries/{summaries_hash}")
-            response.raise_for_status()
-            return response.json()["summaries"]
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return None
-            raise
+        data = await self._get_json_or_none(
+            self._prefixes["community-summaries"] + summaries_hash,
+            large=True
+        )
+        return data["summaries"] if data is not None else None
     
     async def save_query_answer(self, query_hash: str, answer: str):
         """Save query answer to cache."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/query-answers",
-            json={
+        self._l1_invalidate("query-answer", query_hash)
+        return await self._post_json(
+            self._urls["query-answers"],
+            {
                 "query_hash": query_hash,
                 "answer": answer
             }
         )
-        response.raise_for_status()
-        return response.json()
     
     async def get_query_answer(self, query_hash: str) -> Optional[str]:
         """Get cached query answer."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"{self.base_url}/query-answers/{query_hash}")
-            response.raise_for_status()
-            return response.json()["answer"]
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return None
-            raise
+        answer = self._l1_get("query-answer", query_hash)
+        if answer is None:
+            data = await self._get_json_or_none(self._prefixes["query-answers"] + query_hash)
+            answer = data["answer"] if data is not None else None
+            self._l1_put("query-answer", query_hash, answer)
+        return answer
 
 
-
-class RateLimiterClient:
+class RateLimiterClient(BaseServiceClient):
     """Client for rate limiter microservice."""
     
-    def __init__(self, base_url: str):
-        self.base_url = base_url
-        self.timeout = 70.0
-        self._client = None
-    
-    async def _get_client(self):
-        """Get or create persistent HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
-        return self._client
+    ENDPOINTS = {"buckets-init": "/buckets/init"}
     
-    async def close(self):
-        """Close the HTTP client."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+    def __init__(self, base_url: str, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(base_url, timeout=70.0, client=client)
     
     async def initialize_bucket(self, bucket_id: str, capacity: int, refill_rate: float):
         """Initialize token bucket.
@@ -227,172 +401,153 @@ class RateLimiterClient:
             capacity: Maximum number of tokens in the bucket
             refill_rate: Rate at which tokens are added per minute
         """
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/buckets/init",
-            json={
+        return await self._post_json(
+            self._urls["buckets-init"],
+            {
                 "bucket_id": bucket_id,
                 "capacity": capacity,
                 "refill_rate": refill_rate
             }
         )
-        response.raise_for_status()
-        return response.json()
 
 
-class DocumentProcessorClient:
+class DocumentProcessorClient(BaseServiceClient):
     """Client for document processor microservice."""
     
-    def __init__(self, base_url: str):
-        self.base_url = base_url
-        self.timeout = 30.0
-        self._client = None
-    
-    async def _get_client(self):
-        """Get or create persistent HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
-        return self._client
+    ENDPOINTS = {
+        "generate-id": "/generate-id",
+        "chunk": "/chunk"
+    }
     
-    async def close(self):
-        """Close the HTTP client."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+    def __init__(self, base_url: str, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(base_url, timeout=30.0, client=client)
     
-    async def generate_document_id(self, file_path: str, content: str) -> str:
-        """Generate document ID."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/generate-id",
-            json={"file_path": file_path, "content": content}
+    async def generate_document_id(self, file_path: str, content_hash: str) -> str:
+        """Generate document ID from its content hash."""
+        data = await self._post_json(
+            self._urls["generate-id"],
+            {"file_path": file_path, "content_hash": content_hash}
         )
-        response.raise_for_status()
-        return response.json()["document_id"]
-    
-    async def chunk_document(self, document_id: str, content: str, chunk_size: int = 600, chunk_overlap: int = 100) -> List[Dict]:
+        return data["document_id"]
+    
+    async def chunk_document(
+        self,
+        document_id: str,
+        content: str,
+        chunk_size: int = 600,
+        chunk_overlap: int = 100,
+        chunk_unit: str = "characters"
+    ) -> List[Dict]:
         """Chunk document."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/chunk",
-            json={
+        data = await self._post_json(
+            self._urls["chunk"],
+            {
                 "document_id": document_id,
                 "content": content,
                 "chunk_size": chunk_size,
-                "chunk_overlap": chunk_overlap
+                "chunk_overlap": chunk_overlap,
+                "chunk_unit": chunk_unit
             }
         )
-        response.raise_for_status()
-        return response.json()["chunks"]
+        return data["chunks"]
 
 
-class LLMServiceClient:
+class LLMServiceClient(BaseServiceClient):
     """Client for LLM operations microservice."""
     
-    def __init__(self, base_url: str):
-        self.base_url = base_url
-        self.timeout = 300.0  # Longer timeout for LLM operations
-        self._client = None
+    ENDPOINTS = {
+        "extract": "/extract",
+        "summarize-elements": "/summarize/elements",
+        "summarize-communities": "/summarize/communities",
+        "query-answer": "/query/answer",
+        "query-combine": "/query/combine"
+    }
     
-    async def _get_client(self):
-        """Get or create persistent HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
-        return self._client
+    def __init__(self, base_url: str, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(base_url, timeout=300.0, client=client)  # Longer timeout for LLM operations
     
-    async def close(self):
-        """Close the HTTP client."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+    async def _post_json_until_done(self, url: Union[str, httpx.URL], payload: Dict[str, Any]) -> Any:
+        """POST a JSON payload, repeating it while the LLM service answers 202.
+        
+        With the Batch API enabled, the LLM service answers 202 while the batch
+        job for a request is still running. The repeated request attaches to
+        that job, so waiting does not submit (and pay for) another batch.
+        """
+        content = orjson.dumps(payload)
+        while True:
+            response = await self._request("POST", url, content=content, headers=JSON_HEADERS)
+            if response.status_code != 202:
+                return orjson.loads(response.content)
+            
+            data = orjson.loads(response.content)
+            delay = float(response.headers.get("retry-after", BATCH_RETRY_AFTER))
+            logger.info("LLM batch %s still running, checking again in %.0fs", data.get("batch_id"), delay)
+            await asyncio.sleep(delay)
     
     async def extract_elements(self, chunks: List[str]) -> List[str]:
         """Extract elements from chunks."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/extract",
-            json={"chunks": chunks}
-        )
-        response.raise_for_status()
-        return response.json()["elements"]
+        data = await self._post_json_until_done(self._urls["extract"], {"chunks": chunks})
+        return data["elements"]
     
     async def summarize_elements(self, elements: List[str]) -> List[str]:
         """Summarize elements."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/summarize/elements",
-            json={"elements": elements}
-        )
-        response.raise_for_status()
-        return response.json()["summaries"]
+        data = await self._post_json_until_done(self._urls["summarize-elements"], {"elements": elements})
+        return data["summaries"]
     
     async def summarize_communities(self, descriptions: List[Dict]) -> List[str]:
         """Summarize communities."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/summarize/communities",
-            json={"descriptions": descriptions}
-        )
-        response.raise_for_status()
-        return response.json()["summaries"]
+        data = await self._post_json(self._urls["summarize-communities"], {"descriptions": descriptions})
+        return data["summaries"]
     
     async def answer_query(self, summaries: List[str], query: str) -> List[str]:
         """Generate answers from summaries."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/query/answer",
-            json={"summaries": summaries, "query": query}
+        data = await self._post_json(
+            self._urls["query-answer"],
+            {"summaries": summaries, "query": query}
         )
-        response.raise_for_status()
-        return response.json()["answers"]
+        return data["answers"]
     
     async def combine_answers(self, intermediate_answers: List[str]) -> str:
         """Combine intermediate answers."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/query/combine",
-            json={"intermediate_answers": intermediate_answers}
+        data = await self._post_json(
+            self._urls["query-combine"],
+            {"intermediate_answers": intermediate_answers}
         )
-        response.raise_for_status()
-        return response.json()["answer"]
+        return data["answer"]
 
 
-class GraphProcessorClient:
+class GraphProcessorClient(BaseServiceClient):
     """Client for graph processor microservice."""
     
-    def __init__(self, base_url: str):
-        self.base_url = base_url
-        self.timeout = 60.0
-        self._client = None
-    
-    async def _get_client(self):
-        """Get or create persistent HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
-        return self._client
+    ENDPOINTS = {
+        "graph-build": "/graph/build",
+        "community-describe": "/community/describe",
+        "community-describe-and-summarize": "/community/describe-and-summarize"
+    }
     
-    async def close(self):
-        """Close the HTTP client."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+    def __init__(self, base_url: str, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(base_url, timeout=60.0, client=client)
     
     async def build_graph(self, summaries: List[str]) -> Dict[str, Any]:
         """Build graph and detect communities."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/graph/build",
-            json={"summaries": summaries}
-        )
-        response.raise_for_status()
-        return response.json()
+        return await self._post_json(self._urls["graph-build"], {"summaries": summaries})
     
     async def describe_community(self, community_members: List[str]) -> Dict[str, Any]:
         """Get community description."""
-        client = await self._get_client()
-        response = await client.post(
-            f"{self.base_url}/community/describe",
-            json={"community_members": community_members}
+        return await self._post_json(
+            self._urls["community-describe"],
+            {"community_members": community_members}
+        )
+    
+    async def describe_and_summarize(self, communities: List[List[str]]) -> Dict[str, Any]:
+        """Describe communities and summarize them server-side.
+        
+        The graph processor forwards the descriptions to the LLM service
+        itself, so this replaces one describe call per community plus a
+        separate summarize call with a single request.
+        """
+        return await self._post_json(
+            self._urls["community-describe-and-summarize"],
+            {"communities": communities},
+            timeout=300.0  # Includes the LLM summarization
         )
-        response.raise_for_status()
-        return response.json()
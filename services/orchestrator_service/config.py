@@ -0,0 +1,50 @@
+"""Orchestrator configuration, read from environment variables once."""
+import os
+from functools import lru_cache
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class OrchestratorSettings(BaseSettings):
+    """Orchestrator settings; all values without a default must be set."""
+    cache_service_url: str = Field(alias="CACHE_SERVICE_URL")
+    rate_limiter_url: str = Field(alias="RATE_LIMITER_URL")
+    llm_service_url: str = Field(alias="LLM_SERVICE_URL")
+    document_processor_url: str = Field(alias="DOCUMENT_PROCESSOR_URL")
+    graph_processor_url: str = Field(alias="GRAPH_PROCESSOR_URL")
+    
+    chunk_size: int = Field(alias="CHUNK_SIZE")
+    chunk_overlap: int = Field(alias="CHUNK_OVERLAP")
+    # Unit of CHUNK_SIZE and CHUNK_OVERLAP: "characters" or "tokens"
+    chunk_unit: Literal["characters", "tokens"] = Field(default="characters", alias="CHUNK_UNIT")
+    
+    rate_limit_bucket_id: str = Field(alias="RATE_LIMIT_BUCKET_ID")
+    rate_limit_capacity: int = Field(alias="RATE_LIMIT_CAPACITY")
+    rate_limit_refill_rate: float = Field(alias="RATE_LIMIT_REFILL_RATE")
+    
+    redis_host: str = Field(alias="REDIS_HOST")
+    redis_port: int = Field(alias="REDIS_PORT")
+    
+    # Number of API server processes; defaults to one per CPU core
+    api_workers: int = Field(default_factory=lambda: os.cpu_count() or 1, alias="ORCHESTRATOR_WORKERS")
+    
+    # Maximum number of documents an indexing job processes at once
+    index_concurrency: int = Field(default=16, alias="INDEX_CONCURRENCY")
+    # Maximum number of indexing jobs a single worker runs at once
+    index_worker_max_jobs: int = Field(default=4, alias="INDEX_WORKER_MAX_JOBS")
+    
+    class Config:
+        env_file = ".env"
+        case_sensitive = False
+
+
+@lru_cache
+def get_settings() -> OrchestratorSettings:
+    """Return the orchestrator settings, parsed and validated on first use.
+    
+    Raises:
+        ValueError: If a required environment variable is missing or invalid.
+    """
+    return OrchestratorSettings()
@@ -2,8 +2,10 @@
 import logging
 import os
 import asyncio
-from typing import List, Dict, Any
+import hashlib
+from typing import List, Dict, Any, Tuple, AsyncIterator
 
+from config import get_settings
 from clients.service_clients import (
     CacheServiceClient,
     RateLimiterClient,
@@ -41,74 +43,78 @@ class DistributedGraphRAGOrchestrator:
         self.llm_service = llm_service_client
         self.graph_processor = graph_processor_client
         
-        # Get config from environment - no defaults, require explicit configuration
-        chunk_size_str = os.getenv("CHUNK_SIZE")
-        chunk_overlap_str = os.getenv("CHUNK_OVERLAP")
+        # Chunking and rate limiter config - no defaults, require explicit configuration
+        settings = get_settings()
+        self.chunk_size = settings.chunk_size
+        self.chunk_overlap = settings.chunk_overlap
+        self.chunk_unit = settings.chunk_unit
+        self.rate_limit_bucket_id = settings.rate_limit_bucket_id
+        self.rate_limit_capacity = settings.rate_limit_capacity
+        self.rate_limit_refill_rate = settings.rate_limit_refill_rate
+    
+    @staticmethod
+    def list_documents(folder: str) -> List[str]:
+        """List the .txt document paths in a folder, sorted by filename.
         
-        if not chunk_size_str:
-            raise ValueError("CHUNK_SIZE environment variable is required")
-        if not chunk_overlap_str:
-            raise ValueError("CHUNK_OVERLAP environment variable is required")
-            
-        self.chunk_size = int(chunk_size_str)
-        self.chunk_overlap = int(chunk_overlap_str)
+        Blocking; call through ``asyncio.to_thread`` from async code.
+        """
+        try:
+            # scandir yields the file type with each entry, so no extra stat calls are needed
+            with os.scandir(folder) as entries:
+                txt_files = sorted(
+                    entry.path for entry in entries
+                    if entry.name.endswith('.txt') and entry.is_file()
+                )
+        except FileNotFoundError:
+            logger.error("Folder not found: %s", folder)
+            return []
         
-        # Get rate limiter config from environment - no defaults
-        bucket_id = os.getenv("RATE_LIMIT_BUCKET_ID")
-        capacity_str = os.getenv("RATE_LIMIT_CAPACITY")
-        refill_rate_str = os.getenv("RATE_LIMIT_REFILL_RATE")
+        if not txt_files:
+            logger.warning("No .txt files found in %s", folder)
         
-        if not bucket_id:
-            raise ValueError("RATE_LIMIT_BUCKET_ID environment variable is required")
-        if not capacity_str:
-            raise ValueError("RATE_LIMIT_CAPACITY environment variable is required")
-        if not refill_rate_str:
-            raise ValueError("RATE_LIMIT_REFILL_RATE environment variable is required")
-            
-        self.rate_limit_bucket_id = bucket_id
-        self.rate_limit_capacity = int(capacity_str)
-        self.rate_limit_refill_rate = float(refill_rate_str)
+        return txt_files
+    
+    @staticmethod
+    def _read_document(filepath: str) -> str:
+        """Read and strip a single document from disk."""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return f.read().strip()
     
-    def load_documents(self, folder: str) -> List[tuple]:
-        """Load documents from folder (sync operation)."""
-        documents = []
+    async def iter_documents(self, file_paths: List[str]) -> AsyncIterator[Tuple[str, str]]:
+        """Yield (file_path, content) for each non-empty document, one at a time.
         
-        try:
-            if not os.path.exists(folder):
-                logger.error(f"Folder not found: {folder}")
-                return documents
-            
-            txt_files = sorted([f for f in os.listdir(folder) if f.endswith('.txt')])
-            
-            if not txt_files:
-                logger.warning(f"No .txt files found in {folder}")
-                return documents
-            
-            for filename in txt_files:
-                filepath = os.path.join(folder, filename)
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    if content:
-                        documents.append((filepath, content))
-                        logger.info(f"Loaded document from {filename}: {len(content)} chars")
-            
-            logger.info(f"Loaded {len(documents)} documents from {folder}")
-            return documents
+        Files are read in a worker thread as they are consumed, so only the
+        documents currently in flight are held in memory.
+        """
+        for filepath in file_paths:
+            try:
+                content = await asyncio.to_thread(self._read_document, filepath)
+            except Exception as e:
+                logger.error("Error loading document %s: %s", filepath, e, exc_info=True)
+                raise
             
-        except Exception as e:
-            logger.error(f"Error loading documents: {e}", exc_info=True)
-            raise
+            if content:
+                logger.info("Loaded document from %s: %d chars", os.path.basename(filepath), len(content))
+                yield filepath, content
+    
+    async def _aload_one(self, filepath: str) -> Tuple[str, str]:
+        """Read a single document in a worker thread without blocking the event loop."""
+        content = await asyncio.to_thread(self._read_document, filepath)
+        return filepath, content
     
     async def process_document(self, file_path: str, content: str) -> Dict[str, Any]:
         """Process a single document."""
+        # Hash the content once; only the digest is sent to the ID and cache lookups
+        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        
         # Generate document ID
-        doc_id = await self.doc_processor.generate_document_id(file_path, content)
+        doc_id = await self.doc_processor.generate_document_id(file_path, content_hash)
         
         # Check cache
-        cache_check = await self.cache.check_document_cached(file_path, content)
+        cache_check = await self.cache.check_document_cached(file_path, content_hash)
         
         if cache_check["cached"]:
-            logger.info(f"Document {doc_id} found in cache")
+            logger.info("Document %s found in cache", doc_id)
             
             # Get cached data
             chunks = await self.cache.get_chunks(doc_id)
@@ -120,37 +126,26 @@ class DistributedGraphRAGOrchestrator:
                 "summaries": [s["summary"] for s in summaries]
             }
         else:
-            logger.info(f"Processing new document {doc_id}")
-            
-            # Save document
-            await self.cache.save_document(doc_id, file_path, content)
+            logger.info("Processing new document %s", doc_id)
             
             # Chunk document
             chunks = await self.doc_processor.chunk_document(
-                doc_id, content, self.chunk_size, self.chunk_overlap
+                doc_id, content, self.chunk_size, self.chunk_overlap, self.chunk_unit
             )
             
-            # Save chunks
-            await self.cache.save_chunks(doc_id, chunks)
-            
             # Extract elements
             chunk_contents = [c["content"] for c in chunks]
             elements = await self.llm_service.extract_elements(chunk_contents)
             
-            # Save elements
-            await self.cache.save_elements(doc_id, [
-                {"chunk_index": i, "content": elem}
-                for i, elem in enumerate(elements)
-            ])
-            
             # Summarize elements
             summaries = await self.llm_service.summarize_elements(elements)
             
-            # Save summaries
-            await self.cache.save_summaries(doc_id, [
-                {"element_id": i, "summary": summ}
-                for i, summ in enumerate(summaries)
-            ])
+            # Save only once all LLM work has succeeded: the saved document marks
+            # it as cached, so a document that failed midway must not be saved
+            await self.cache.save_document(doc_id, file_path, content)
+            await self.cache.save_chunks(doc_id, chunks)
+            await self.cache.save_elements(doc_id, elements)
+            await self.cache.save_summaries(doc_id, summaries)
             
             return {
                 "document_id": doc_id,
@@ -158,12 +153,29 @@ class DistributedGraphRAGOrchestrator:
                 "summaries": summaries
             }
     
+    @staticmethod
+    def _hash_summaries(summaries: List[str]) -> str:
+        """Compute an order-independent hash of a set of summaries.
+        
+        Each summary is hashed on its own and the sorted 16-byte digests are
+        fed into a top-level hash, so the summaries are never concatenated
+        or copied into one large string.
+        """
+        digests = sorted(
+            hashlib.blake2b(summary.encode(), digest_size=16).digest()
+            for summary in summaries
+        )
+        hasher = hashlib.blake2b(digest_size=16)
+        for digest in digests:
+            hasher.update(digest)
+        return hasher.hexdigest()
+    
     async def run_pipeline_async(self, query: str, documents_folder: str) -> str:
         """Execute the complete Graph RAG pipeline asynchronously."""
         logger.info("=" * 80)
         logger.info("Starting Distributed Graph RAG Pipeline")
-        logger.info(f"Query: {query}")
-        logger.info(f"Documents folder: {documents_folder}")
+        logger.info("Query: %s", query)
+        logger.info("Documents folder: %s", documents_folder)
         logger.info("=" * 80)
         
         # Initialize rate limiter with config from environment
@@ -173,28 +185,46 @@ class DistributedGraphRAGOrchestrator:
                 capacity=self.rate_limit_capacity,
                 refill_rate=self.rate_limit_refill_rate
             )
-            logger.info(f"Rate limiter initialized: bucket_id={self.rate_limit_bucket_id}, capacity={self.rate_limit_capacity}, refill_rate={self.rate_limit_refill_rate}")
+            logger.info(
+                "Rate limiter initialized: bucket_id=%s, capacity=%s, refill_rate=%s",
+                self.rate_limit_bucket_id, self.rate_limit_capacity, self.rate_limit_refill_rate
+            )
         except Exception as e:
-            logger.warning(f"Could not initialize rate limiter: {e}")
+            logger.warning("Could not initialize rate limiter: %s", e)
         
-        # Load documents (sync)
-        documents = self.load_documents(documents_folder)
+        # Read documents concurrently and start processing each one as soon as
+        # it is loaded, so disk reads overlap with the downstream service calls
+        file_paths = await asyncio.to_thread(self.list_documents, documents_folder)
+        load_tasks = [self._aload_one(fp) for fp in file_paths]
+        # Documents finish loading in any order; keyed by path so results
+        # can be collected in file order
+        tasks = {}
+        try:
+            # Leaving the task group waits for all documents; the first
+            # failure cancels the documents still in flight
+            async with asyncio.TaskGroup() as tg:
+                for load in asyncio.as_completed(load_tasks):
+                    file_path, content = await load
+                    if content:
+                        logger.info("Loaded document from %s: %d chars", os.path.basename(file_path), len(content))
+                        tasks[file_path] = tg.create_task(self.process_document(file_path, content))
+                
+                logger.info("Processing %d documents in parallel...", len(tasks))
+        except* Exception as eg:
+            # Surface the first failure itself rather than the exception group
+            raise eg.exceptions[0]
         
-        # Process all documents in parallel
-        logger.info(f"Processing {len(documents)} documents in parallel...")
-        tasks = [self.process_document(file_path, content) for file_path, content in documents]
-        results = await asyncio.gather(*tasks)
+        results = [tasks[fp].result() for fp in file_paths if fp in tasks]
         
         # Collect all summaries
         all_summaries = []
         for result in results:
             all_summaries.extend(result["summaries"])
         
-        logger.info(f"Collected {len(all_summaries)} summaries from {len(documents)} documents")
+        logger.info("Collected %d summaries from %d documents", len(all_summaries), len(results))
         
         # Create cache key based on summaries AND query
-        import hashlib
-        summaries_hash = hashlib.md5(str(sorted(all_summaries)).encode()).hexdigest()
+        summaries_hash = self._hash_summaries(all_summaries)
         query_hash = hashlib.md5(f"{summaries_hash}:{query}".encode()).hexdigest()
         
         # **NEW: Check for cached final answer for this exact query+documents combination**
@@ -226,8 +256,8 @@ class DistributedGraphRAGOrchestrator:
             )
             logger.info("Graph saved to Neo4j")
         
-        logger.info(f"Graph: {graph_result['nodes']} nodes, {graph_result['edges']} edges")
-        logger.info(f"Communities: {len(communities)}")
+        logger.info("Graph: %s nodes, %s edges", graph_result['nodes'], graph_result['edges'])
+        logger.info("Communities: %d", len(communities))
         
         if not communities:
             logger.warning("No communities detected")
@@ -245,24 +275,21 @@ class DistributedGraphRAGOrchestrator:
             
             if cached_descriptions:
                 logger.info("Using cached community descriptions from Neo4j")
-                community_descriptions = cached_descriptions
+                logger.info("Summarizing %d communities...", len(communities))
+                community_summaries = await self.llm_service.summarize_communities(cached_descriptions)
             else:
-                logger.info(f"Describing {len(communities)} communities in parallel...")
-                # Get community descriptions in parallel (FIXED: removed unused all_summaries parameter)
-                community_tasks = [
-                    self.graph_processor.describe_community(community["members"])
-                    for community in communities
-                ]
-                community_descriptions = await asyncio.gather(*community_tasks)
+                # Describe and summarize in one round trip; the graph processor
+                # forwards the descriptions to the LLM service itself
+                logger.info("Describing and summarizing %d communities...", len(communities))
+                described = await self.graph_processor.describe_and_summarize(
+                    [community["members"] for community in communities]
+                )
+                community_summaries = described["summaries"]
                 
                 # Save to Neo4j
-                await self.cache.save_community_descriptions(summaries_hash, community_descriptions)
+                await self.cache.save_community_descriptions(summaries_hash, described["descriptions"])
                 logger.info("Community descriptions saved to Neo4j")
             
-            # Summarize communities (only if not cached)
-            logger.info(f"Summarizing {len(communities)} communities...")
-            community_summaries = await self.llm_service.summarize_communities(community_descriptions)
-            
             # Save community summaries to cache
             await self.cache.save_community_summaries(summaries_hash, community_summaries)
             logger.info("Community summaries saved to Neo4j")
@@ -1,7 +1,7 @@
 """Orchestrator routes for Graph RAG pipeline."""
 import logging
 from typing import Optional
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel, Field
 
 from services.orchestrator_service import OrchestratorService
@@ -13,6 +13,12 @@ router = APIRouter(
     tags=["orchestrator"]
 )
 
+# WebSocket endpoints live outside the /api prefix
+ws_router = APIRouter(
+    prefix="/ws",
+    tags=["orchestrator"]
+)
+
 # Create global service instance
 orchestrator_service = OrchestratorService()
 
@@ -48,17 +54,14 @@ class QueryResponse(BaseModel):
 
 
 @router.post("/index", response_model=IndexResponse)
-async def index_documents(request: IndexRequest, background_tasks: BackgroundTasks):
+async def index_documents(request: IndexRequest):
     """
     Index documents from the specified folder.
-    This runs in the background and returns immediately.
+    This queues a job for the indexing workers and returns immediately.
     """
     try:
-        # Start indexing in background
-        job_id = await orchestrator_service.start_indexing(
-            request.documents_folder,
-            background_tasks
-        )
+        # Queue indexing for the worker pool
+        job_id = await orchestrator_service.start_indexing(request.documents_folder)
         
         return IndexResponse(
             status="started",
@@ -66,7 +69,7 @@ async def index_documents(request: IndexRequest, background_tasks: BackgroundTas
             job_id=job_id
         )
     except Exception as e:
-        logger.error(f"Error starting indexing: {e}", exc_info=True)
+        logger.error("Error starting indexing: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -87,14 +90,52 @@ async def query_documents(request: QueryRequest):
             answer=answer
         )
     except Exception as e:
-        logger.error(f"Error processing query: {e}", exc_info=True)
+        logger.error("Error processing query: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/status/{job_id}")
-async def get_indexing_status(job_id: str):
-    """Get the status of an indexing job."""
-    status = orchestrator_service.get_job_status(job_id)
+async def get_indexing_status(
+    job_id: str,
+    wait: float = Query(
+        default=0.0,
+        ge=0.0,
+        le=60.0,
+        description="Seconds to wait for the job to finish before returning (long polling)"
+    )
+):
+    """Get the status of an indexing job.
+    
+    With ``wait`` set, the request is held until the job completes or fails,
+    or until ``wait`` seconds have passed, whichever comes first.
+    """
+    if wait > 0:
+        status = await orchestrator_service.wait_for_job_status(job_id, wait)
+    else:
+        status = await orchestrator_service.get_job_status(job_id)
     if status is None:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
     return status
+
+
+@ws_router.websocket("/jobs/{job_id}")
+async def watch_indexing_job(websocket: WebSocket, job_id: str):
+    """Push the status of an indexing job on every change until it finishes.
+    
+    Sends the current status on connect, then one message per progress
+    update, and closes after the completed or failed status has been sent.
+    Closes with code 4404 if the job is unknown.
+    """
+    await websocket.accept()
+    sent = False
+    try:
+        async for status in orchestrator_service.watch_job_status(job_id):
+            await websocket.send_json(status)
+            sent = True
+    except WebSocketDisconnect:
+        return
+    
+    if sent:
+        await websocket.close()
+    else:
+        await websocket.close(code=4404, reason=f"Job {job_id} not found")
@@ -0,0 +1,37 @@
+"""Redis-backed job queue for indexing jobs."""
+from arq.connections import RedisSettings
+
+from config import get_settings
+
+# Name of the arq function that runs an indexing job (see worker.py)
+INDEX_JOB = "index_job"
+
+# How long finished job results and progress counters are kept in Redis
+JOB_RETENTION_SECONDS = 24 * 60 * 60
+
+# Events published on a job's events channel
+JOB_PROGRESS_EVENT = "progress"
+JOB_FINISHED_EVENT = "finished"
+
+
+def progress_key(job_id: str) -> str:
+    """Redis key of the hash holding an indexing job's progress counters."""
+    return f"index-job-progress:{job_id}"
+
+
+def events_channel(job_id: str) -> str:
+    """Redis pub/sub channel notified when an indexing job progresses or finishes."""
+    return f"index-job-events:{job_id}"
+
+
+def get_redis_settings() -> RedisSettings:
+    """Build arq Redis settings from the orchestrator settings.
+    
+    Returns:
+        RedisSettings: Connection settings shared by the API and the worker.
+    
+    Raises:
+        ValueError: If required environment variables are not set.
+    """
+    settings = get_settings()
+    return RedisSettings(host=settings.redis_host, port=settings.redis_port)
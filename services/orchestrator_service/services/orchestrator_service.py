@@ -1,10 +1,11 @@
 """Orchestrator service implementation."""
 import logging
-import os
 import asyncio
-import uuid
-from typing import Optional, Dict, Any
-from fastapi import BackgroundTasks
+from typing import Optional, Dict, Any, Callable, Awaitable, AsyncIterator
+
+import httpx
+from arq import ArqRedis, create_pool
+from arq.jobs import Job, JobStatus
 
 # Import from local modules
 from clients.service_clients import (
@@ -12,12 +13,31 @@ from clients.service_clients import (
     RateLimiterClient,
     DocumentProcessorClient,
     LLMServiceClient,
-    GraphProcessorClient
+    GraphProcessorClient,
+    create_http_client
 )
+from config import get_settings
 from distributed_orchestrator import DistributedGraphRAGOrchestrator
+from services.job_queue import (
+    INDEX_JOB,
+    JOB_FINISHED_EVENT,
+    events_channel,
+    get_redis_settings,
+    progress_key
+)
 
 logger = logging.getLogger(__name__)
 
+# Job states after which the status of an indexing job no longer changes
+TERMINAL_JOB_STATES = ("completed", "failed")
+
+# Documents read ahead of the consumers; bounds the memory an indexing job holds
+INDEX_QUEUE_SIZE = 32
+
+# Seconds a job watcher waits for an event before re-reading the job status; a
+# worker that dies mid-job publishes no event, but its job status still changes
+JOB_STATUS_RECHECK_INTERVAL = 30.0
+
 
 class OrchestratorService:
     """Service for managing Graph RAG orchestration."""
@@ -25,36 +45,25 @@ class OrchestratorService:
     def __init__(self):
         """Initialize the orchestrator service."""
         self.orchestrator: Optional[DistributedGraphRAGOrchestrator] = None
-        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.redis: Optional[ArqRedis] = None
+        self.http_client: Optional[httpx.AsyncClient] = None
+        # Maximum number of documents an indexing job processes at once
+        self.index_concurrency = get_settings().index_concurrency
         self._initialize_orchestrator()
     
     def _initialize_orchestrator(self):
         """Initialize the distributed orchestrator with service clients."""
         try:
-            # Get service URLs from environment - no defaults, must be provided
-            cache_url = os.getenv("CACHE_SERVICE_URL")
-            rate_limiter_url = os.getenv("RATE_LIMITER_URL")
-            llm_url = os.getenv("LLM_SERVICE_URL")
-            doc_processor_url = os.getenv("DOCUMENT_PROCESSOR_URL")
-            graph_processor_url = os.getenv("GRAPH_PROCESSOR_URL")
-            
-            if not cache_url:
-                raise ValueError("CACHE_SERVICE_URL environment variable is required")
-            if not rate_limiter_url:
-                raise ValueError("RATE_LIMITER_URL environment variable is required")
-            if not llm_url:
-                raise ValueError("LLM_SERVICE_URL environment variable is required")
-            if not doc_processor_url:
-                raise ValueError("DOCUMENT_PROCESSOR_URL environment variable is required")
-            if not graph_processor_url:
-                raise ValueError("GRAPH_PROCESSOR_URL environment variable is required")
+            # Service URLs are required settings - no defaults, must be provided
+            settings = get_settings()
             
-            # Create service clients
-            cache_client = CacheServiceClient(cache_url)
-            rate_limiter_client = RateLimiterClient(rate_limiter_url)
-            doc_processor_client = DocumentProcessorClient(doc_processor_url)
-            llm_client = LLMServiceClient(llm_url)
-            graph_processor_client = GraphProcessorClient(graph_processor_url)
+            # Create service clients sharing one connection pool
+            self.http_client = create_http_client()
+            cache_client = CacheServiceClient(settings.cache_service_url, client=self.http_client)
+            rate_limiter_client = RateLimiterClient(settings.rate_limiter_url, client=self.http_client)
+            doc_processor_client = DocumentProcessorClient(settings.document_processor_url, client=self.http_client)
+            llm_client = LLMServiceClient(settings.llm_service_url, client=self.http_client)
+            graph_processor_client = GraphProcessorClient(settings.graph_processor_url, client=self.http_client)
             
             # Create orchestrator
             self.orchestrator = DistributedGraphRAGOrchestrator(
@@ -67,70 +76,115 @@ class OrchestratorService:
             
             logger.info("Orchestrator initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize orchestrator: {e}", exc_info=True)
+            logger.error("Failed to initialize orchestrator: %s", e, exc_info=True)
             raise
     
-    async def _run_indexing_job(self, job_id: str, documents_folder: str):
-        """Run indexing job in background."""
-        try:
-            self.jobs[job_id]["status"] = "running"
-            logger.info(f"Starting indexing job {job_id} for folder: {documents_folder}")
-            
-            # Load and process all documents
-            documents = self.orchestrator.load_documents(documents_folder)
-            
-            if not documents:
-                self.jobs[job_id]["status"] = "failed"
-                self.jobs[job_id]["error"] = "No documents found"
-                return
-            
-            # Process documents
-            tasks = [
-                self.orchestrator.process_document(file_path, content)
-                for file_path, content in documents
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Check for errors
-            errors = [r for r in results if isinstance(r, Exception)]
-            if errors:
-                self.jobs[job_id]["status"] = "failed"
-                self.jobs[job_id]["error"] = str(errors[0])
-                logger.error(f"Indexing job {job_id} failed: {errors[0]}")
-            else:
-                self.jobs[job_id]["status"] = "completed"
-                self.jobs[job_id]["documents_processed"] = len(documents)
-                logger.info(f"Indexing job {job_id} completed successfully")
+    async def connect(self):
+        """Connect to the Redis job queue used for indexing jobs."""
+        if self.redis is None:
+            self.redis = await create_pool(get_redis_settings())
+            logger.info("Connected to indexing job queue")
+    
+    async def close(self):
+        """Close the job queue connection and the shared HTTP client."""
+        if self.redis is not None:
+            await self.redis.aclose()
+            self.redis = None
         
-        except Exception as e:
-            self.jobs[job_id]["status"] = "failed"
-            self.jobs[job_id]["error"] = str(e)
-            logger.error(f"Indexing job {job_id} failed with exception: {e}", exc_info=True)
+        await self.http_client.aclose()
     
-    async def start_indexing(
+    async def run_indexing_job(
         self,
         documents_folder: str,
-        background_tasks: BackgroundTasks
-    ) -> str:
-        """Start indexing documents in background."""
-        job_id = str(uuid.uuid4())
+        on_progress: Optional[Callable[[int, int], Awaitable[None]]] = None
+    ) -> Dict[str, Any]:
+        """Index all documents in a folder (runs in the indexing worker).
         
-        # Initialize job tracking
-        self.jobs[job_id] = {
-            "status": "pending",
-            "documents_folder": documents_folder,
-            "created_at": asyncio.get_event_loop().time()
-        }
+        Documents are streamed from disk through a bounded queue to
+        ``INDEX_CONCURRENCY`` consumers, so reading overlaps with processing,
+        memory stays bounded and a large folder does not flood the downstream
+        services with requests. The job fails fast: the first document that
+        still fails after retries cancels the rest.
+        
+        Args:
+            documents_folder: Path to folder containing documents to index.
+            on_progress: Optional callback awaited with (processed, total)
+                document counts at the start and after each document. The
+                total starts as the number of files and drops to the number
+                of non-empty documents once all files have been read.
+        
+        Raises:
+            RuntimeError: If no documents are found or any document fails.
+        """
+        file_paths = await asyncio.to_thread(self.orchestrator.list_documents, documents_folder)
+        
+        if not file_paths:
+            raise RuntimeError("No documents found")
+        
+        total = len(file_paths)
+        processed = 0
+        queue: asyncio.Queue = asyncio.Queue(maxsize=INDEX_QUEUE_SIZE)
+        
+        async def produce():
+            nonlocal total
+            produced = 0
+            async for document in self.orchestrator.iter_documents(file_paths):
+                await queue.put(document)
+                produced += 1
+            # Empty files are skipped while reading, so only now is the total known
+            if produced < total:
+                total = produced
+                if on_progress is not None:
+                    await on_progress(processed, total)
+            # One sentinel per consumer signals that no documents are left
+            for _ in range(self.index_concurrency):
+                await queue.put(None)
+        
+        async def consume():
+            nonlocal processed
+            while (document := await queue.get()) is not None:
+                file_path, content = document
+                await self.orchestrator.process_document(file_path, content)
+                processed += 1
+                if on_progress is not None:
+                    await on_progress(processed, total)
         
-        # Add to background tasks
-        background_tasks.add_task(self._run_indexing_job, job_id, documents_folder)
+        if on_progress is not None:
+            await on_progress(0, total)
         
-        return job_id
+        # The task group cancels all sibling tasks as soon as one fails, so the
+        # job is marked failed right away instead of after the whole folder.
+        # Transient errors have already been retried per request, so whatever
+        # is left (bad input, a downstream service that is down, unreadable
+        # files) would most likely fail the remaining documents as well.
+        # Errors are re-raised as plain errors so the job result can be stored
+        # and read back by the API regardless of the original type
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(produce())
+                for _ in range(self.index_concurrency):
+                    tg.create_task(consume())
+        except* Exception as eg:
+            error = eg.exceptions[0]
+            logger.error(
+                "Indexing of %s aborted after %d of %d documents: %s",
+                documents_folder, processed, total, error
+            )
+            raise RuntimeError(str(error)) from None
+        
+        logger.info("Indexing of %s completed successfully", documents_folder)
+        return {"documents_processed": processed, "documents_skipped": len(file_paths) - total}
+    
+    async def start_indexing(self, documents_folder: str) -> str:
+        """Queue an indexing job for the worker pool and return its job ID."""
+        job = await self.redis.enqueue_job(INDEX_JOB, documents_folder)
+        logger.info("Queued indexing job %s for folder: %s", job.job_id, documents_folder)
+        return job.job_id
     
     async def query(self, query: str, documents_folder: str = "test_docs") -> str:
         """Query the indexed documents."""
         try:
-            logger.info(f"Processing query: {query}")
+            logger.info("Processing query: %s", query)
             
             # Run the full pipeline
             answer = await self.orchestrator.run_pipeline_async(
@@ -141,9 +195,105 @@ class OrchestratorService:
             return answer
         
         except Exception as e:
-            logger.error(f"Query failed: {e}", exc_info=True)
+            logger.error("Query failed: %s", e, exc_info=True)
             raise
     
-    def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """Get the status of an indexing job."""
-        return self.jobs.get(job_id)
+    async def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get the status of an indexing job.
+        
+        Returns:
+            Optional[Dict[str, Any]]: Job status with one of ``pending``,
+                ``running``, ``completed`` or ``failed``, or None if unknown.
+        """
+        job = Job(job_id, self.redis)
+        status = await job.status()
+        if status == JobStatus.not_found:
+            return None
+        
+        info = await job.info()
+        if info is None:
+            return None
+        
+        job_status: Dict[str, Any] = {
+            "status": "pending",
+            "documents_folder": info.args[0] if info.args else None,
+            "created_at": info.enqueue_time.timestamp()
+        }
+        
+        if status == JobStatus.in_progress:
+            job_status["status"] = "running"
+            progress = await self.redis.hgetall(progress_key(job_id))
+            job_status.update({key.decode(): int(value) for key, value in progress.items()})
+        elif status == JobStatus.complete:
+            result = await job.result_info()
+            if result.success:
+                job_status["status"] = "completed"
+                job_status.update(result.result)
+            else:
+                job_status["status"] = "failed"
+                job_status["error"] = str(result.result)
+        
+        return job_status
+    
+    @staticmethod
+    async def _wait_for_event(pubsub, event: Optional[str] = None) -> None:
+        """Wait for the next event (or the next ``event``) on a subscribed channel."""
+        async for message in pubsub.listen():
+            if message["type"] == "message" and (event is None or message["data"].decode() == event):
+                return
+    
+    async def wait_for_job_status(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """Get the status of an indexing job, waiting for it to finish.
+        
+        Blocks until the job completes or fails, or until ``timeout`` seconds
+        have passed, so clients can long-poll instead of polling on a timer.
+        
+        Returns:
+            Optional[Dict[str, Any]]: Latest job status, or None if unknown.
+        """
+        async with self.redis.pubsub() as pubsub:
+            # Subscribe before reading the status so a job finishing in
+            # between cannot be missed
+            await pubsub.subscribe(events_channel(job_id))
+            
+            status = await self.get_job_status(job_id)
+            if status is None or status["status"] in TERMINAL_JOB_STATES:
+                return status
+            
+            try:
+                await asyncio.wait_for(
+                    self._wait_for_event(pubsub, JOB_FINISHED_EVENT),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                pass
+        
+        return await self.get_job_status(job_id)
+    
+    async def watch_job_status(self, job_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the status of an indexing job each time it changes.
+        
+        The current status is yielded first; iteration ends once the job
+        has completed or failed, or immediately if the job is unknown. The
+        status is also re-read every ``JOB_STATUS_RECHECK_INTERVAL`` seconds
+        without an event, so a job whose worker died is not watched forever.
+        """
+        async with self.redis.pubsub() as pubsub:
+            await pubsub.subscribe(events_channel(job_id))
+            
+            status = await self.get_job_status(job_id)
+            while status is not None:
+                yield status
+                if status["status"] in TERMINAL_JOB_STATES:
+                    return
+                
+                previous = status
+                while status == previous:
+                    try:
+                        await asyncio.wait_for(self._wait_for_event(pubsub), timeout=JOB_STATUS_RECHECK_INTERVAL)
+                    except asyncio.TimeoutError:
+                        pass
+                    status = await self.get_job_status(job_id)
+                    # Events without a visible change (and quiet intervals) are not yielded
+                    if status is None:
+                        return
@@ -0,0 +1,90 @@
+"""Indexing worker for the orchestrator, run with ``arq worker.WorkerSettings``."""
+import asyncio
+import logging
+import os
+from typing import Dict, Any
+
+import uvloop
+from arq import func
+
+from config import get_settings
+from services.job_queue import (
+    INDEX_JOB,
+    JOB_FINISHED_EVENT,
+    JOB_PROGRESS_EVENT,
+    JOB_RETENTION_SECONDS,
+    events_channel,
+    get_redis_settings,
+    progress_key
+)
+from services.orchestrator_service import OrchestratorService
+
+# Configure logging
+log_level = os.getenv("LOG_LEVEL", "INFO")
+logging.basicConfig(
+    level=log_level,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# arq creates its event loop after importing these settings, so the worker runs on uvloop
+asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+async def startup(ctx: Dict[str, Any]):
+    """Create the orchestrator service shared by all jobs of this worker."""
+    ctx["orchestrator_service"] = OrchestratorService()
+    logger.info("Indexing worker started")
+
+
+async def shutdown(ctx: Dict[str, Any]):
+    """Close the orchestrator service clients."""
+    await ctx["orchestrator_service"].close()
+    logger.info("Indexing worker shutting down")
+
+
+async def index_job(ctx: Dict[str, Any], documents_folder: str) -> Dict[str, Any]:
+    """Index all documents in a folder.
+    
+    Args:
+        ctx: arq job context.
+        documents_folder: Path to folder containing documents to index.
+    
+    Returns:
+        Dict[str, Any]: Job result with the number of documents processed.
+    """
+    logger.info("Starting indexing job %s for folder: %s", ctx['job_id'], documents_folder)
+    redis = ctx["redis"]
+    key = progress_key(ctx["job_id"])
+    channel = events_channel(ctx["job_id"])
+    
+    async def report_progress(processed: int, total: int):
+        # Stored in Redis so any orchestrator replica can report it, and
+        # expired along with the job result
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"documents_processed": processed, "documents_total": total})
+            pipe.expire(key, JOB_RETENTION_SECONDS)
+            pipe.publish(channel, JOB_PROGRESS_EVENT)
+            await pipe.execute()
+    
+    return await ctx["orchestrator_service"].run_indexing_job(documents_folder, report_progress)
+
+
+async def after_job_end(ctx: Dict[str, Any]):
+    """Notify status watchers that this job has finished; its result is already stored."""
+    await ctx["redis"].publish(events_channel(ctx["job_id"]), JOB_FINISHED_EVENT)
+
+
+class WorkerSettings:
+    """arq worker configuration."""
+    functions = [func(index_job, name=INDEX_JOB)]
+    on_startup = startup
+    on_shutdown = shutdown
+    after_job_end = after_job_end
+    redis_settings = get_redis_settings()
+    # Bound the number of indexing jobs a single worker runs concurrently
+    max_jobs = get_settings().index_worker_max_jobs
+    # Indexing large folders can take well beyond arq's 5 minute default
+    job_timeout = 3600
+    # Keep results for status requests, then let Redis expire them
+    keep_result = JOB_RETENTION_SECONDS
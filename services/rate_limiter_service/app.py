@@ -59,5 +59,11 @@ app.include_router(health_router)
 app.include_router(rate_limiter_router)
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8002)
+    import asyncio
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+    # Serve with hypercorn, as in the container: the service clients speak
+    # HTTP/2 with prior knowledge, which uvicorn does not accept
+    config = Config()
+    config.bind = ["0.0.0.0:8002"]
+    asyncio.run(serve(app, config))
@@ -159,8 +159,8 @@ async def consume_tokens(request: TokenRequest, response: Response):
                 response.headers["X-RateLimit-Reset"] = str(int(asyncio.get_event_loop().time()))
                 
                 logger.debug(
-                    f"Consumed {request.tokens} tokens from '{request.bucket_id}', "
-                    f"{remaining_tokens:.0f} remaining"
+                    "Consumed %d tokens from '%s', %.0f remaining",
+                    request.tokens, request.bucket_id, remaining_tokens
                 )
                 return {
                     "status": "success",
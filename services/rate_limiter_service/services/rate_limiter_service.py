@@ -277,8 +277,8 @@ class RateLimiterService:
                         pipe.execute()
                         
                         logger.debug(
-                            f"Consumed {tokens} tokens from '{bucket_id}', "
-                            f"{available_tokens - tokens:.0f} remaining"
+                            "Consumed %d tokens from '%s', %.0f remaining",
+                            tokens, bucket_id, available_tokens - tokens
                         )
                         
                         return {
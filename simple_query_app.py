@@ -1,8 +1,26 @@
 #!/usr/bin/env python3
 """Simple interactive terminal app for Graph RAG querying."""
 import os
+import json
 import asyncio
 import httpx
+import websockets
+
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None
+
+# Service endpoints, read from the environment once at startup
+ORCHESTRATOR_URL = os.getenv("ORCHESTRATOR_URL", "http://localhost:8000")
+CACHE_SERVICE_URL = os.getenv("CACHE_SERVICE_URL", "http://localhost:8001")
+
+# One pooled client is reused for every request the app makes
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+HTTP_TIMEOUT = httpx.Timeout(connect=5.0, read=300.0, write=300.0, pool=5.0)
+
+# Longest wait for an indexing job, matching the indexing worker's job timeout
+INDEX_WAIT_TIMEOUT = 3600.0
 
 # ANSI color codes
 class Colors:
@@ -16,26 +34,41 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Static screens and prompts, formatted once at import
+HEADER_STR = (
+    f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}\n"
+    "   Graph RAG Query System\n"
+    f"{'='*60}{Colors.ENDC}\n"
+)
+MENU_STR = (
+    f"{Colors.OKCYAN}Please select an option:{Colors.ENDC}\n"
+    f"  {Colors.BOLD}1{Colors.ENDC} - Index documents\n"
+    f"  {Colors.BOLD}2{Colors.ENDC} - Query documents\n"
+    f"  {Colors.BOLD}3{Colors.ENDC} - Clear documents cache\n"
+    f"  {Colors.BOLD}4{Colors.ENDC} - Exit\n"
+)
+CHOICE_PROMPT = f"{Colors.BOLD}Enter choice (1-4): {Colors.ENDC}"
+INVALID_CHOICE_STR = f"{Colors.WARNING}Invalid choice. Please enter 1, 2, 3, or 4.{Colors.ENDC}\n"
+
+
+async def ainput(prompt: str) -> str:
+    """Read a line from stdin in a worker thread, keeping the event loop free."""
+    return await asyncio.to_thread(input, prompt)
+
+
 def print_header():
     """Print welcome header."""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}")
-    print("   Graph RAG Query System")
-    print(f"{'='*60}{Colors.ENDC}\n")
+    print(HEADER_STR)
 
 
 def print_menu():
     """Print main menu."""
-    print(f"{Colors.OKCYAN}Please select an option:{Colors.ENDC}")
-    print(f"  {Colors.BOLD}1{Colors.ENDC} - Index documents")
-    print(f"  {Colors.BOLD}2{Colors.ENDC} - Query documents")
-    print(f"  {Colors.BOLD}3{Colors.ENDC} - Clear documents cache")
-    print(f"  {Colors.BOLD}4{Colors.ENDC} - Exit")
-    print()
+    print(MENU_STR)
 
 
 async def index_documents(client: httpx.AsyncClient, orchestrator_url: str):
     """Index documents."""
-    folder = input(f"{Colors.OKBLUE}Enter folder name (default: test_docs): {Colors.ENDC}").strip()
+    folder = (await ainput(f"{Colors.OKBLUE}Enter folder name (default: test_docs): {Colors.ENDC}")).strip()
     if not folder:
         folder = "test_docs"
     
@@ -54,29 +87,33 @@ async def index_documents(client: httpx.AsyncClient, orchestrator_url: str):
         print(f"{Colors.OKGREEN}✓ Indexing started (Job ID: {job_id}){Colors.ENDC}")
         print(f"{Colors.OKCYAN}Waiting for indexing to complete...{Colors.ENDC}\n")
         
-        # Poll for completion
-        for _ in range(60):
-            await asyncio.sleep(2)
-            status_response = await client.get(f"{orchestrator_url}/api/status/{job_id}")
-            status = status_response.json()
-            
-            if status["status"] == "completed":
-                docs = status.get("documents_processed", "unknown")
-                print(f"{Colors.OKGREEN}✓ Indexing completed! Processed {docs} documents.{Colors.ENDC}\n")
-                return
-            elif status["status"] == "failed":
-                print(f"{Colors.FAIL}✗ Indexing failed: {status.get('error')}{Colors.ENDC}\n")
-                return
+        # Follow the job over a WebSocket; the orchestrator pushes every status change
+        ws_url = orchestrator_url.replace("http", "ws", 1)
+        async with asyncio.timeout(INDEX_WAIT_TIMEOUT), websockets.connect(f"{ws_url}/ws/jobs/{job_id}") as websocket:
+            async for message in websocket:
+                status = json.loads(message)
+                
+                if status["status"] == "completed":
+                    docs = status.get("documents_processed", "unknown")
+                    print(f"{Colors.OKGREEN}✓ Indexing completed! Processed {docs} documents.{Colors.ENDC}\n")
+                    return
+                elif status["status"] == "failed":
+                    print(f"{Colors.FAIL}✗ Indexing failed: {status.get('error')}{Colors.ENDC}\n")
+                    return
+                elif "documents_total" in status:
+                    print(f"{Colors.OKCYAN}  ... {status['documents_processed']}/{status['documents_total']} documents processed{Colors.ENDC}")
         
-        print(f"{Colors.WARNING}⚠ Indexing taking longer than expected...{Colors.ENDC}\n")
+        print(f"{Colors.WARNING}⚠ Lost track of indexing job {job_id}{Colors.ENDC}\n")
     
+    except TimeoutError:
+        print(f"{Colors.WARNING}⚠ Timed out waiting for indexing job {job_id}{Colors.ENDC}\n")
     except Exception as e:
         print(f"{Colors.FAIL}✗ Error: {e}{Colors.ENDC}\n")
 
 
 async def query_documents(client: httpx.AsyncClient, orchestrator_url: str):
     """Query documents."""
-    query = input(f"{Colors.OKBLUE}Enter your question: {Colors.ENDC}").strip()
+    query = (await ainput(f"{Colors.OKBLUE}Enter your question: {Colors.ENDC}")).strip()
     
     if not query:
         print(f"{Colors.WARNING}⚠ No query entered.{Colors.ENDC}\n")
@@ -103,7 +140,7 @@ async def query_documents(client: httpx.AsyncClient, orchestrator_url: str):
 
 async def clear_cache(client: httpx.AsyncClient, orchestrator_url: str):
     """Clear all Neo4j cache."""
-    confirm = input(f"{Colors.WARNING}⚠ This will delete ALL data from Neo4j. Continue? (yes/no): {Colors.ENDC}").strip().lower()
+    confirm = (await ainput(f"{Colors.WARNING}⚠ This will delete ALL data from Neo4j. Continue? (yes/no): {Colors.ENDC}")).strip().lower()
     
     if confirm != "yes":
         print(f"{Colors.OKCYAN}Cache clear cancelled.{Colors.ENDC}\n")
@@ -112,11 +149,8 @@ async def clear_cache(client: httpx.AsyncClient, orchestrator_url: str):
     print(f"\n{Colors.OKCYAN}Clearing Neo4j cache...{Colors.ENDC}")
     
     try:
-        # Get the cache service URL from environment or use default
-        cache_url = os.getenv("CACHE_SERVICE_URL", "http://localhost:8001")
-        
         # Clear all data
-        response = await client.delete(f"{cache_url}/admin/clear-all", timeout=30.0)
+        response = await client.delete(f"{CACHE_SERVICE_URL}/admin/clear-all", timeout=30.0)
         response.raise_for_status()
         result = response.json()
         
@@ -129,26 +163,25 @@ async def clear_cache(client: httpx.AsyncClient, orchestrator_url: str):
 
 async def main():
     """Main application loop."""
-    orchestrator_url = os.getenv("ORCHESTRATOR_URL", "http://localhost:8000")
+    orchestrator_url = ORCHESTRATOR_URL
     
     print_header()
     
-    # Check connection
-    try:
-        async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT) as client:
+        # Check connection
+        try:
             response = await client.get(f"{orchestrator_url}/health", timeout=5.0)
             response.raise_for_status()
             print(f"{Colors.OKGREEN}✓ Connected to orchestrator{Colors.ENDC}\n")
-    except Exception as e:
-        print(f"{Colors.FAIL}✗ Cannot connect to orchestrator at {orchestrator_url}{Colors.ENDC}")
-        print(f"{Colors.FAIL}  Error: {e}{Colors.ENDC}\n")
-        return
-    
-    # Main loop
-    async with httpx.AsyncClient() as client:
+        except Exception as e:
+            print(f"{Colors.FAIL}✗ Cannot connect to orchestrator at {orchestrator_url}{Colors.ENDC}")
+            print(f"{Colors.FAIL}  Error: {e}{Colors.ENDC}\n")
+            return
+        
+        # Main loop
         while True:
             print_menu()
-            choice = input(f"{Colors.BOLD}Enter choice (1-4): {Colors.ENDC}").strip()
+            choice = (await ainput(CHOICE_PROMPT)).strip()
             print()
             
             if choice == "1":
@@ -161,11 +194,13 @@ async def main():
                 print(f"{Colors.OKCYAN}Goodbye!{Colors.ENDC}\n")
                 break
             else:
-                print(f"{Colors.WARNING}Invalid choice. Please enter 1, 2, 3, or 4.{Colors.ENDC}\n")
+                print(INVALID_CHOICE_STR)
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # Prefer the faster uvloop event loop where it is available
+        run = uvloop.run if uvloop is not None else asyncio.run
+        run(main())
     except KeyboardInterrupt:
         print(f"\n\n{Colors.OKCYAN}Interrupted. Goodbye!{Colors.ENDC}\n")